@@ -4,10 +4,17 @@ Create left side text overlay for wide character cards by adding character stats
 abilities, and other text elements to the left side of existing wide cards.
 """
 
+import io
 import json
+import math
+import multiprocessing
 import os
+import pickle
 import re
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any
 
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
@@ -17,8 +24,83 @@ try:
 except Exception:
     yaml = None
 
-# Global cache for YAML ability definitions (normalized-name keyed)
-ABILITIES_YAML: Dict[str, Dict[str, Any]] = {}
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
+
+# Prefer the libyaml-backed loader; the pure-Python SafeLoader is much slower
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None)
+_YAML_HAS_LIBYAML = _YAML_LOADER is not None
+if yaml is not None and _YAML_LOADER is None:
+    _YAML_LOADER = yaml.SafeLoader
+
+# Parsed + normalized ability maps keyed by (yaml_path, mtime)
+_YAML_CACHE: Dict[Tuple[str, float], Dict[str, Dict[str, Any]]] = {}
+
+
+# Candidate font files per (bold, italic) style, in order of preference
+_FONT_CANDIDATES: Dict[Tuple[bool, bool], List[str]] = {
+    (True, True): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-BoldOblique.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Oblique.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-BoldItalic.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Italic.ttf",
+        "/System/Library/Fonts/Verdana Italic.ttf",
+        "C:/Windows/Fonts/verdana.ttf",
+    ],
+    (False, True): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Oblique.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Italic.ttf",
+        "/System/Library/Fonts/Verdana Italic.ttf",
+        "C:/Windows/Fonts/verdana.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ],
+    (True, False): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "/System/Library/Fonts/Verdana Bold.ttf",
+        "C:/Windows/Fonts/verdana.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ],
+    (False, False): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/TTF/verdana.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        "/System/Library/Fonts/Verdana.ttf",
+        "C:/Windows/Fonts/verdana.ttf",
+    ],
+}
+
+
+def _resolve_font_path(bold: bool, italic: bool):
+    for font_path in _FONT_CANDIDATES[(bold, italic)]:
+        if os.path.exists(font_path):
+            return font_path
+    return None
+
+
+# Resolve each style's font file once at import instead of probing on every call
+_FONT_PATHS = {style: _resolve_font_path(*style) for style in _FONT_CANDIDATES}
+
+# Card text is Latin-only, so the basic layout engine (no RAQM/HarfBuzz shaping)
+# is sufficient and noticeably faster; detect its availability once.
+_LAYOUT_KWARGS = {"layout_engine": ImageFont.Layout.BASIC} if hasattr(ImageFont, "Layout") else {}  # type: ignore[attr-defined]
+
+
+@lru_cache(maxsize=None)
+def _load_font(size: int, bold: bool, italic: bool):
+    font_path = _FONT_PATHS[(bold, italic)]
+    if font_path:
+        return ImageFont.truetype(font_path, size, **_LAYOUT_KWARGS)
+
+    # Fallback to default font
+    return ImageFont.load_default()
 
 
 def get_font(size, bold=False, italic=False):
@@ -26,104 +108,277 @@ def get_font(size, bold=False, italic=False):
 
     Attempts to pick an italic face when italic=True. Falls back gracefully to
     a regular face if an italic face is unavailable on the system.
-    """
-    # Preferred families (regular/bold/italic variants when available)
-    if italic and bold:
-        preferred = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-BoldOblique.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Oblique.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-BoldItalic.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Italic.ttf",
-            "/System/Library/Fonts/Verdana Italic.ttf",
-            "C:/Windows/Fonts/verdana.ttf",
-        ]
-    elif italic:
-        preferred = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Oblique.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Italic.ttf",
-            "/System/Library/Fonts/Verdana Italic.ttf",
-            "C:/Windows/Fonts/verdana.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        ]
-    elif bold:
-        preferred = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "/System/Library/Fonts/Verdana Bold.ttf",
-            "C:/Windows/Fonts/verdana.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        ]
-    else:
-        preferred = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/TTF/verdana.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-            "/System/Library/Fonts/Verdana.ttf",
-            "C:/Windows/Fonts/verdana.ttf",
-        ]
-
-    for font_path in preferred:
-        try:
-            if os.path.exists(font_path):
-                try:
-                    return ImageFont.truetype(font_path, size, layout_engine=ImageFont.Layout.BASIC)  # type: ignore[attr-defined]
-                except Exception:
-                    return ImageFont.truetype(font_path, size)
-        except Exception:
-            continue
 
-    # Fallback to default font
-    try:
-        return ImageFont.load_default()
-    except Exception:
-        return ImageFont.load_default()
+    Faces are cached per (size, bold, italic); arguments are normalized first so
+    positional/keyword call styles share one face and one set of measurements.
+    """
+    return _load_font(int(size), bool(bold), bool(italic))
 
 
 def get_character_name_font(character_name, max_width, draw):
-    """Get character name font that fits within max_width, starting large and scaling down."""
-    for size in range(48, 12, -1):
-        font = get_font(size, bold=True)
-        bbox = draw.textbbox((0, 0), character_name, font=font)
-        text_width = bbox[2] - bbox[0]
-        if text_width <= max_width:
-            return font
+    """Get the largest bold font (48 down to 13) whose name width fits max_width.
+
+    Advance widths scale almost linearly with font size, so measure once at 48,
+    jump to the proportional size estimate and step from there to correct for
+    hinting. Falls back to size 12.
+    """
+    def fits(size):
+        return text_width(get_font(size, bold=True), character_name) <= max_width
+
+    full_w = text_width(get_font(48, bold=True), character_name)
+    if full_w <= max_width:
+        return get_font(48, bold=True)
+    size = max(13, min(47, int(48 * max_width / full_w)))
+    if fits(size):
+        while size < 47 and fits(size + 1):
+            size += 1
+        return get_font(size, bold=True)
+    while size > 13:
+        size -= 1
+        if fits(size):
+            return get_font(size, bold=True)
     return get_font(12, bold=True)
 
 
 # ---------- Helpers for left-side layout ----------
 
+# Cache of textbbox results keyed by (id(font), text). Fonts come from the
+# get_font cache and live for the whole process, so their ids stay stable.
+_BBOX_CACHE: Dict[Tuple[int, str], Tuple[int, int, int, int]] = {}
+_WIDTH_CACHE: Dict[Tuple[int, str], int] = {}
+_LENGTH_CACHE: Dict[Tuple[int, str], float] = {}
+_CHAR_W_CACHE: Dict[Tuple[int, str], int] = {}
+# Summed glyph widths of whole words as measured by wrap_text
+_WORD_W_CACHE: Dict[Tuple[int, str], int] = {}
+# Wrapped lines keyed by (id(font), text, max_width)
+_WRAP_CACHE: Dict[Tuple[int, str, int], Tuple[str, ...]] = {}
+
+
+# Size-only measurements go through a tiny standalone image rather than the
+# card being drawn; the bbox at the origin does not depend on the target.
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("L", (1, 1)))
+
+
+def measure_text(draw, text, font):
+    """Return draw.textbbox((0, 0), text, font=font), memoized per (font, text).
+
+    The bbox is measured on _MEASURE_DRAW; draw is accepted so call sites read
+    the same as a direct textbbox.
+    """
+    key = (id(font), text)
+    bbox = _BBOX_CACHE.get(key)
+    if bbox is None:
+        bbox = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+        _BBOX_CACHE[key] = bbox
+    return bbox
+
+
+def text_width(font, text):
+    """Return the advance width of text (rounded up), memoized per (font, text).
+
+    Cheaper than a textbbox when only the width is needed.
+    """
+    key = (id(font), text)
+    width = _WIDTH_CACHE.get(key)
+    if width is None:
+        width = math.ceil(text_length(font, text))
+        _WIDTH_CACHE[key] = width
+    return width
+
+
+def text_length(font, text):
+    """Return font.getlength(text) unrounded, memoized per (font, text)."""
+    key = (id(font), text)
+    length = _LENGTH_CACHE.get(key)
+    if length is None:
+        length = font.getlength(text)
+        _LENGTH_CACHE[key] = length
+    return length
+
+
+def first_line_word_count(font, words, max_width):
+    """Return how many leading words fit on one line of max_width (at least one).
+
+    Same result as re-measuring each growing prefix ' '.join(words[:k]), but
+    each word is measured once and the advances are accumulated.
+    """
+    if not words:
+        return 0
+    space = text_length(font, " ")
+    total = text_length(font, words[0])
+    count = 1
+    for w in words[1:]:
+        total += space + text_length(font, w)
+        if math.ceil(total) > max_width:
+            break
+        count += 1
+    return count
+
+
+def char_width(draw, ch, font):
+    """Return the textbbox width of a single glyph, memoized per (font, char).
+
+    Per-character layout sums these for every glyph on a card, so caching the
+    subtracted width avoids a bbox lookup and tuple unpack per character.
+    """
+    key = (id(font), ch)
+    width = _CHAR_W_CACHE.get(key)
+    if width is None:
+        bb = measure_text(draw, ch, font)
+        width = bb[2] - bb[0]
+        _CHAR_W_CACHE[key] = width
+    return width
+
+
+def font_line_height(draw, font):
+    """Return the "Ag" bbox bottom used as a line height, cached on the font object."""
+    line_h = getattr(font, '_cached_line_h', None)
+    if line_h is None:
+        line_h = measure_text(draw, "Ag", font)[3]
+        font._cached_line_h = line_h
+    return line_h
+
+
+@lru_cache(maxsize=4096)
+def _text_tile(text, font):
+    """Rasterize text once as an 'L' coverage tile; returns (tile, (dx, dy)).
+
+    (dx, dy) is the ink offset from the draw origin, as in font.getbbox.
+    """
+    left, top, right, bottom = font.getbbox(text)
+    tile = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(tile).text((-left, -top), text, fill=255, font=font)
+    return tile, (left, top)
+
+
+def draw_cached_text(draw, xy, text, font, fill):
+    """Same as draw.text(xy, text, fill=fill, font=font) for integer xy, but the
+    glyph coverage is cached so strings repeated across cards (stat headers,
+    base labels, shared keyword lines) are rasterized only once per process.
+    """
+    tile, (dx, dy) = _text_tile(text, font)
+    draw.bitmap((xy[0] + dx, xy[1] + dy), tile, fill=fill)
+
+
+def _greedy_line_breaks(widths, lengths, space_w, max_width, starts, ends):
+    """Greedy word wrap over precomputed word widths; returns the line count n.
+
+    Line k spans words[starts[k]:ends[k]] for k < n. A word that does not fit
+    starts a new line, but a line always takes at least one word. A line
+    holding only an empty word (from repeated spaces) is replaced by the next
+    word, or dropped at the end. Compiled with numba when it is available;
+    the arrays may be numpy int arrays or lists.
+    """
+    n = 0
+    line_w = 0
+    line_empty = True
+    for i in range(len(widths)):
+        w = widths[i]
+        if line_empty:
+            starts[n] = i
+            line_w = w
+            line_empty = lengths[i] == 0
+        elif line_w + space_w + w <= max_width:
+            line_w += space_w + w
+        else:
+            ends[n] = i
+            n += 1
+            starts[n] = i
+            line_w = w
+            line_empty = lengths[i] == 0
+    if not line_empty:
+        ends[n] = len(widths)
+        n += 1
+    return n
+
+
+if njit is not None and np is not None:
+    _greedy_line_breaks = njit(cache=True)(_greedy_line_breaks)
+
+
+_ASCII_W_TABLES: Dict[int, Any] = {}
+
+
+def _ascii_text_width(draw, text, font):
+    """Sum of char_width over an ASCII string, gathered from a per-font width
+    table indexed by code point. Table entries are filled on first use.
+    """
+    table = _ASCII_W_TABLES.get(id(font))
+    if table is None:
+        table = np.full(128, -1, dtype=np.int64) if np is not None else [-1] * 128
+        _ASCII_W_TABLES[id(font)] = table
+    raw = text.encode('ascii')
+    if np is not None:
+        codes = np.frombuffer(raw, dtype=np.uint8)
+        widths = table[codes]
+        if (widths < 0).any():
+            for c in set(raw):
+                if table[c] < 0:
+                    table[c] = char_width(draw, chr(c), font)
+            widths = table[codes]
+        return int(widths.sum())
+    total = 0
+    for c in raw:
+        w = table[c]
+        if w < 0:
+            w = table[c] = char_width(draw, chr(c), font)
+        total += w
+    return total
+
+
 def wrap_text(draw, text, font, max_width):
     """Wrap text into lines that fit within max_width without breaking words.
 
     Uses special-width handling for the '∅' glyph so the measurement reflects its
-    slightly larger rendered size.
+    slightly larger rendered size. Each word is measured once and line widths are
+    accumulated, rather than re-measuring every growing line prefix. Word widths
+    are memoized per font, since card text reuses the same vocabulary heavily,
+    and new ASCII words are summed from a per-font glyph width table; the break
+    positions come from the (optionally numba-compiled)
+    _greedy_line_breaks kernel. Whole results are memoized per (font, text,
+    max_width), since the fit search and the draw pass wrap the same strings.
     """
     if not text:
         return []
+    wrap_key = (id(font), text, max_width)
+    cached = _WRAP_CACHE.get(wrap_key)
+    if cached is not None:
+        return list(cached)
+    special_font = None
+    font_id = id(font)
     def measure_width(t: str) -> int:
-        total = 0
-        for ch in t:
-            use_font = font
-            if ch == '∅':
-                use_font = get_font(max(8, int(getattr(font, 'size', 16) * 1.25)))
-            bb = draw.textbbox((0, 0), ch, font=use_font)
-            total += (bb[2] - bb[0])
+        nonlocal special_font
+        key = (font_id, t)
+        total = _WORD_W_CACHE.get(key)
+        if total is None:
+            if '∅' in t:
+                if special_font is None:
+                    special_font = get_font(max(8, int(getattr(font, 'size', 16) * 1.25)))
+                total = sum(char_width(draw, ch, special_font if ch == '∅' else font) for ch in t)
+            elif t.isascii():
+                total = _ascii_text_width(draw, t, font)
+            else:
+                total = sum(char_width(draw, ch, font) for ch in t)
+            _WORD_W_CACHE[key] = total
         return total
+    space_w = measure_width(" ")
     words = text.split(' ')
-    lines: List[str] = []
-    line = ""
-    for w in words:
-        if line:
-            test = line + " " + w
-        else:
-            test = w
-        if measure_width(test) <= max_width or not line:
-            line = test
-        else:
-            lines.append(line)
-            line = w
-    if line:
-        lines.append(line)
+    n_words = len(words)
+    # Arrays only pay off for the compiled kernel; the plain-Python kernel is
+    # faster over lists than indexing numpy scalars one at a time
+    if njit is not None and np is not None:
+        widths = np.fromiter((measure_width(w) for w in words), dtype=np.int64, count=n_words)
+        lengths = np.fromiter((len(w) for w in words), dtype=np.int64, count=n_words)
+        starts = np.empty(n_words, dtype=np.int64)
+        ends = np.empty(n_words, dtype=np.int64)
+    else:
+        widths = [measure_width(w) for w in words]
+        lengths = [len(w) for w in words]
+        starts = [0] * n_words
+        ends = [0] * n_words
+    n_lines = _greedy_line_breaks(widths, lengths, space_w, max_width, starts, ends)
+    lines = [" ".join(words[starts[k]:ends[k]]) for k in range(n_lines)]
+    _WRAP_CACHE[wrap_key] = tuple(lines)
     return lines
 
 
@@ -135,107 +390,188 @@ def draw_text_with_special_symbols(draw: ImageDraw.ImageDraw, x: int, y: int, te
     """
     if not text:
         return x
-    special_font = get_font(max(8, int(getattr(base_font, 'size', 16) * special_scale)), italic=italic)
+    special_font = None
+    if '∅' in text:
+        special_font = get_font(max(8, int(getattr(base_font, 'size', 16) * special_scale)), italic=italic)
+        # Baseline align: nudge down slightly; constant for the font pair
+        ascent_base = abs(measure_text(draw, "Ag", base_font)[1])
+        ascent_spec = abs(measure_text(draw, "Ag", special_font)[1])
+        # Move the symbol up a bit compared to previous version
+        baseline_offset = max(0, (ascent_base - ascent_spec) - 1)
+    # Glyphs are laid out one by one by their bbox widths and stamped from the
+    # cached per-(glyph, font) coverage tiles, so FreeType rasterizes each
+    # glyph once per process instead of on every draw.
     cursor_x = x
     for ch in text:
         if ch == '∅':
-            tb = draw.textbbox((0, 0), ch, font=special_font)
-            # Baseline align: nudge down slightly
-            ascent_base = abs(draw.textbbox((0, 0), "Ag", font=base_font)[1])
-            ascent_spec = abs(draw.textbbox((0, 0), "Ag", font=special_font)[1])
-            # Move the symbol up a bit compared to previous version
-            baseline_offset = max(0, (ascent_base - ascent_spec) - 1)
-            draw.text((cursor_x, y + baseline_offset), ch, fill=fill, font=special_font)
-            cursor_x += (tb[2] - tb[0])
+            draw_cached_text(draw, (cursor_x, y + baseline_offset), ch, special_font, fill)
+            cursor_x += char_width(draw, ch, special_font)
         else:
-            draw.text((cursor_x, y), ch, fill=fill, font=base_font)
-            tb = draw.textbbox((0, 0), ch, font=base_font)
-            cursor_x += (tb[2] - tb[0])
+            if ch != ' ':
+                draw_cached_text(draw, (cursor_x, y), ch, base_font, fill)
+            cursor_x += char_width(draw, ch, base_font)
     return cursor_x
 
 
+_TAG_RE = re.compile(r'\[([^:]*):')
+
+
 def draw_styled_text(draw: ImageDraw.ImageDraw, x: int, y: int, text: str, base_font: ImageFont.FreeTypeFont, bold_font: ImageFont.FreeTypeFont, fill: Tuple[int, int, int, int]) -> int:
     """Draw text with two inline styles:
     - scale '∅' slightly larger (delegates to draw_text_with_special_symbols)
     - bold any tag name between '[' and ':' (e.g., [Protection: ...])
     Returns new x after drawing.
     """
-    cursor_x = x
-    pos = 0
-    while pos < len(text):
-        lb = text.find('[', pos)
-        colon = text.find(':', lb + 1) if lb != -1 else -1
-        if lb != -1 and colon != -1 and lb >= pos:
-            # before '['
-            cursor_x = draw_text_with_special_symbols(draw, cursor_x, y, text[pos:lb], base_font, fill)
-            # draw '[', then bold tag, then ':'
-            cursor_x = draw_text_with_special_symbols(draw, cursor_x, y, "[", base_font, fill)
-            tag = text[lb + 1:colon]
-            if tag:
-                cursor_x = draw_text_with_special_symbols(draw, cursor_x, y, tag, bold_font, fill)
-            cursor_x = draw_text_with_special_symbols(draw, cursor_x, y, ":", base_font, fill)
-            pos = colon + 1
+    # Most body lines carry no tag at all; skip segmenting for them
+    if '[' not in text:
+        return draw_text_with_special_symbols(draw, x, y, text, base_font, fill)
+
+    # Collect [text, font] segments, merging adjacent runs that share a font
+    # (e.g. the text before '[' plus the '[' itself) so each span is one call.
+    segments: List[List[Any]] = []
+
+    def add(seg: str, font: ImageFont.FreeTypeFont) -> None:
+        if not seg:
+            return
+        if segments and segments[-1][1] is font:
+            segments[-1][0] += seg
         else:
-            cursor_x = draw_text_with_special_symbols(draw, cursor_x, y, text[pos:], base_font, fill)
-            break
+            segments.append([seg, font])
+
+    # One left-to-right scan: each '[' up to the next ':' is a tag
+    last = 0
+    for m in _TAG_RE.finditer(text):
+        # before '[' and the '[' itself, then bold tag, then ':'
+        add(text[last:m.start() + 1], base_font)
+        add(m.group(1), bold_font)
+        add(":", base_font)
+        last = m.end()
+    add(text[last:], base_font)
+
+    cursor_x = x
+    for seg, font in segments:
+        cursor_x = draw_text_with_special_symbols(draw, cursor_x, y, seg, font, fill)
     return cursor_x
 
 
 # ---------- YAML helpers ----------
 
+_RE_QUOTES = re.compile(r"[\"'\u201c\u201d\u2018\u2019]")
+_RE_WS = re.compile(r"\s+")
+_RE_DIGITS = re.compile(r"\d+")
+# Arcane outcome "<tokens>: <description>", split at the first colon
+_RE_OUTCOME = re.compile(r"([^:]*)(?::(.*))?", re.S)
+
+# Typographic quotes/dashes and non-breaking spaces mapped to plain ASCII
+_QUOTE_TRANSLATE = str.maketrans({
+    "\u201c": '"', "\u201d": '"',
+    "\u2018": "'", "\u2019": "'",
+    "\u2013": "-", "\u2014": "-",
+    "\u00a0": " ",
+})
+
+
 def normalize_quotes(s: str) -> str:
     if not isinstance(s, str):
         return s
-    return (
-        s.replace("\u201c", '"').replace("\u201d", '"')
-        .replace("\u2018", "'").replace("\u2019", "'")
-        .replace("\u2013", "-")
-        .replace("\u2014", "-")
-        .replace("\u00a0", " ")
-        .replace("”", '"').replace("“", '"').replace("’", "'").replace("‘", "'")
-    )
+    return s.translate(_QUOTE_TRANSLATE)
 
 
+@lru_cache(maxsize=4096)
 def norm_key(s: str) -> str:
+    """Lookup key for an ability name; memoized since names repeat across cards."""
     s = normalize_quotes(s or "").strip().lower()
-    s = re.sub(r"[\"'“”‘’]", "", s)
-    s = re.sub(r"\s+", " ", s)
+    s = _RE_QUOTES.sub("", s)
+    s = _RE_WS.sub(" ", s)
     return s
 
 
-def load_yaml_abilities(yaml_path: str) -> Dict[str, Dict[str, Any]]:
-    global ABILITIES_YAML
-    ABILITIES_YAML = {}
-    if not os.path.exists(yaml_path):
-        return {}
+def _load_pickled_abilities(pickle_path: str, source_path: str, mtime: float):
+    """Return the pickled ability map if it was built from source_path at this mtime."""
+    try:
+        with open(pickle_path, "rb") as f:
+            cached = pickle.load(f)
+        if isinstance(cached, dict) and cached.get("source") == source_path and cached.get("mtime") == mtime:
+            return cached.get("data")
+    except Exception:
+        pass
+    return None
+
+
+def _save_pickled_abilities(pickle_path: str, source_path: str, mtime: float, data: Dict[str, Dict[str, Any]]) -> None:
+    try:
+        with open(pickle_path, "wb") as f:
+            pickle.dump({"source": source_path, "mtime": mtime, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        print(f"Warning: Failed to write abilities cache {pickle_path}: {e}")
+
+
+def _normalize_abilities(data: Any) -> Dict[str, Dict[str, Any]]:
+    """Key raw ability definitions by norm_key and fill in the optional fields."""
+    abilities: Dict[str, Dict[str, Any]] = {}
+    for key, val in (data.items() if isinstance(data, dict) else []):
+        if not isinstance(val, dict):
+            continue
+        nkey = norm_key(str(key))
+        val = dict(val)
+        val.setdefault("type", None)
+        val.setdefault("isPulse", False)
+        val.setdefault("textToRightInItalics", None)
+        val.setdefault("arcaneSubText", None)
+        val.setdefault("activatedText", None)
+        val.setdefault("arcaneOutcomes", None)
+        val.setdefault("catastrophe", None)
+        val.setdefault("range", None)
+        val.setdefault("cost", None)
+        val["__name"] = normalize_quotes(str(key))
+        abilities[nkey] = val
+    return abilities
+
+
+def _read_abilities_source(yaml_path: str):
+    """Return the raw ability data from the YAML file, or None when it cannot be read."""
     if yaml is None:
         print("Warning: PyYAML not installed; cannot read abilities_strings.yaml. Falling back to JSON data only.")
+        return None
+    if not _YAML_HAS_LIBYAML:
+        print("Warning: libyaml not available; parsing abilities YAML with the pure-Python loader.")
+    with open(yaml_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+def load_yaml_abilities(yaml_path: str) -> Dict[str, Dict[str, Any]]:
+    """Load and normalize the YAML ability definitions.
+
+    Parsed maps are cached in-process keyed on (path, mtime), and persisted to a
+    '<yaml>.pkl' sidecar tagged with the same path and mtime, so later runs skip
+    YAML parsing until the file changes.
+    """
+    if not os.path.exists(yaml_path):
         return {}
+    mtime = os.path.getmtime(yaml_path)
+    cache_key = (yaml_path, mtime)
+    pickle_path = yaml_path + ".pkl"
+    cached = _YAML_CACHE.get(cache_key)
+    if cached is None:
+        cached = _load_pickled_abilities(pickle_path, yaml_path, mtime)
+        if cached is not None:
+            _YAML_CACHE[cache_key] = cached
+    if cached is not None:
+        return cached
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        for key, val in (data.items() if isinstance(data, dict) else []):
-            if not isinstance(val, dict):
-                continue
-            nkey = norm_key(str(key))
-            val = dict(val)
-            val.setdefault("type", None)
-            val.setdefault("isPulse", False)
-            val.setdefault("textToRightInItalics", None)
-            val.setdefault("arcaneSubText", None)
-            val.setdefault("activatedText", None)
-            val.setdefault("arcaneOutcomes", None)
-            val.setdefault("catastrophe", None)
-            val.setdefault("range", None)
-            val.setdefault("cost", None)
-            val["__name"] = normalize_quotes(str(key))
-            ABILITIES_YAML[nkey] = val
-        return ABILITIES_YAML
+        data = _read_abilities_source(yaml_path)
+        if data is None:
+            return {}
+        abilities = _normalize_abilities(data)
+        _YAML_CACHE[cache_key] = abilities
+        _save_pickled_abilities(pickle_path, yaml_path, mtime, abilities)
+        return abilities
     except Exception as e:
         print(f"Warning: Failed to load YAML abilities from {yaml_path}: {e}")
         return {}
 
 
+@lru_cache(maxsize=4096)
 def parse_yaml_outcome(outcome_str: str) -> Tuple[str, int, str]:
     """Parse a YAML arcane outcome string like 'gX,bX: Target suffers X Dmg.'
     Returns (value_text, color_mask, description).
@@ -244,16 +580,13 @@ def parse_yaml_outcome(outcome_str: str) -> Tuple[str, int, str]:
     For multiple values of the same color (e.g. 'b2,b3'), returns "2 or 3".
     """
     s = normalize_quotes(outcome_str or "").strip()
-    if ":" in s:
-        left, right = s.split(":", 1)
-        desc = right.strip()
-    else:
-        left, desc = s, ""
-    tokens = [t.strip() for t in left.split(",") if t.strip()]
+    m = _RE_OUTCOME.match(s)
+    left, desc = m.group(1), (m.group(2) or "").strip()
     mask = 0
     value_text = "X"
     values = []  # Collect all values
-    for tok in tokens:
+    for tok in left.split(","):
+        tok = tok.strip()
         if not tok:
             continue
         c = tok[0].lower()
@@ -279,6 +612,7 @@ def parse_yaml_outcome(outcome_str: str) -> Tuple[str, int, str]:
 
 # ---------- Text helpers ----------
 
+@lru_cache(maxsize=4096)
 def ensure_period(text: str) -> str:
     """Ensure text ends with a period. Leave empty strings unchanged."""
     s = (text or "").rstrip()
@@ -289,6 +623,22 @@ def ensure_period(text: str) -> str:
     return s + "."
 
 
+@lru_cache(maxsize=256)
+def inch_text_from_yaml(val) -> str:
+    """Format a range value as ' N"' (bare digits get an inch mark); '' when unset."""
+    if val is None or val == "":
+        return ""
+    try:
+        if isinstance(val, (int, float)):
+            return f" {int(val)}\""
+        s = normalize_quotes(str(val))
+        if _RE_DIGITS.fullmatch(s):
+            s = f"{s}\""
+        return f" {s}"
+    except Exception:
+        return ""
+
+
 def draw_stats_box(draw, x, y, width, character_data, text_draw_override=None):
     """Draw a boxed stats area (Melee, Range, Arcane, Evade). Returns bottom y."""
     text_draw = text_draw_override or draw
@@ -322,8 +672,8 @@ def draw_stats_box(draw, x, y, width, character_data, text_draw_override=None):
     value_font = get_font(28, bold=True)
     padding = 8
     col_width = width // 4
-    header_height = draw.textbbox((0, 0), "Ag", font=header_font)[3]
-    value_height = draw.textbbox((0, 0), "Ag", font=value_font)[3]
+    header_height = font_line_height(draw, header_font)
+    value_height = font_line_height(draw, value_font)
     box_height = padding + header_height + 6 + value_height + padding
 
     draw.rectangle([x, y, x + width, y + box_height], outline=(0, 0, 0, 255), width=2)
@@ -335,25 +685,61 @@ def draw_stats_box(draw, x, y, width, character_data, text_draw_override=None):
 
     for i, h in enumerate(headers):
         cx = x + i * col_width
-        text_bbox = draw.textbbox((0, 0), h, font=header_font)
+        text_bbox = measure_text(draw, h, header_font)
         tw = text_bbox[2] - text_bbox[0]
         tx = cx + (col_width - tw) // 2
         ty = y + padding
-        text_draw.text((tx, ty), h, fill=(0, 0, 0, 255), font=header_font)
+        draw_cached_text(text_draw, (tx, ty), h, header_font, (0, 0, 0, 255))
 
     base_y = sep_y + 6
     for i, v in enumerate(values):
         v_str = str(v)
         cx = x + i * col_width
-        text_bbox = draw.textbbox((0, 0), v_str, font=value_font)
+        text_bbox = measure_text(draw, v_str, value_font)
         tw = text_bbox[2] - text_bbox[0]
         # Slight left and upward nudge for better visual balance
         tx = cx + (col_width - tw) // 2 - 4
-        text_draw.text((tx, base_y - 2), v_str, fill=(0, 0, 0, 255), font=value_font)
+        draw_cached_text(text_draw, (tx, base_y - 2), v_str, value_font, (0, 0, 0, 255))
 
     return y + box_height
 
 
+def _compute_pip_centers(start_x, usable_width, extra_gap_factor, centers):
+    """Fill centers[0..14] with the x centre of each health pip.
+
+    Pips are evenly pitched with a wider gap (extra_gap_factor * pitch) after
+    the 5th and 10th pip. Centres are truncated to ints. Compiled with numba
+    when it is available; centers may be a numpy int array or a list.
+    """
+    total_gaps = 14 + 2 * extra_gap_factor
+    pitch = usable_width / total_gaps
+    big_gap = extra_gap_factor * pitch
+    x_cursor = float(start_x)
+    for idx in range(15):
+        centers[idx] = int(x_cursor)
+        if idx < 14:
+            x_cursor += pitch
+            if idx == 4 or idx == 9:
+                x_cursor += big_gap
+
+
+if njit is not None and np is not None:
+    _compute_pip_centers = njit(cache=True)(_compute_pip_centers)
+
+
+@lru_cache(maxsize=8)
+def _pip_masks(dot_d, stroke, inset):
+    """Return (ring, disc) uint8 masks for one health pip of diameter dot_d.
+
+    Rasterized once with ImageDraw.ellipse so they match the per-pip drawing.
+    """
+    ring = Image.new("L", (dot_d + 1, dot_d + 1), 0)
+    ImageDraw.Draw(ring).ellipse([0, 0, dot_d, dot_d], outline=255, width=stroke)
+    disc = Image.new("L", (dot_d + 1, dot_d + 1), 0)
+    ImageDraw.Draw(disc).ellipse([inset, inset, dot_d - inset, dot_d - inset], fill=255)
+    return np.asarray(ring), np.asarray(disc)
+
+
 def draw_bottom_row(draw, text_left, bottom_boundary, text_right, character_data, text_draw_override=None):
     """Draw heart + up-to-15 health pips and base size label. Returns top Y of this row."""
     text_draw = text_draw_override or draw
@@ -363,31 +749,27 @@ def draw_bottom_row(draw, text_left, bottom_boundary, text_right, character_data
 
     heart_font = get_font(32, bold=True)
     heart_y = y + 0
-    heart_bbox = draw.textbbox((0, 0), "\u2665", font=heart_font)
-    heart_w = heart_bbox[2] - heart_bbox[0]
-    text_draw.text((text_left, heart_y), "\u2665", fill=(0, 0, 0, 255), font=heart_font)
+    heart_w = text_width(heart_font, "\u2665")
+    draw_cached_text(text_draw, (text_left, heart_y), "\u2665", heart_font, (0, 0, 0, 255))
 
     # Right-aligned two-line base block
     base_map = {0: "30MM", 1: "40MM"}
     bs_val = base_map.get(character_data.get('baseSize', 0), "30MM")
     base_lbl_font = get_font(16, bold=True)
     base_val_font = get_font(18, bold=False)
-    bb1 = draw.textbbox((0, 0), "Base:", font=base_lbl_font)
-    bb2 = draw.textbbox((0, 0), bs_val, font=base_val_font)
+    bb1 = measure_text(draw, "Base:", base_lbl_font)
+    bb2 = measure_text(draw, bs_val, base_val_font)
     base_w = max(bb1[2] - bb1[0], bb2[2] - bb2[0])
     base_h = (bb1[3] - bb1[1]) + 2 + (bb2[3] - bb2[1])
     # Align tight to the bottom-right inside the text area
     base_x = text_right - base_w + 10
     base_y_top = y + row_height - base_h - 14
-    text_draw.text((base_x + (base_w - (bb1[2] - bb1[0])), base_y_top), "Base:", fill=(0, 0, 0, 255), font=base_lbl_font)
+    draw_cached_text(text_draw, (base_x + (base_w - (bb1[2] - bb1[0])), base_y_top), "Base:", base_lbl_font, (0, 0, 0, 255))
     val_y = base_y_top + (bb1[3] - bb1[1]) + 2
-    text_draw.text((base_x + (base_w - (bb2[2] - bb2[0])), val_y), bs_val, fill=(0, 0, 0, 255), font=base_val_font)
+    draw_cached_text(text_draw, (base_x + (base_w - (bb2[2] - bb2[0])), val_y), bs_val, base_val_font, (0, 0, 0, 255))
 
-    try:
-        maxhp = int(character_data.get('maxhp') or 0)
-    except Exception:
-        maxhp = 0
-    maxhp = max(0, min(15, maxhp))
+    maxhp = character_data.get('maxhp')
+    maxhp = max(0, min(15, maxhp if isinstance(maxhp, int) else 0))
 
     start_x = text_left + heart_w + 20
     end_x = base_x - 10
@@ -400,19 +782,8 @@ def draw_bottom_row(draw, text_left, bottom_boundary, text_right, character_data
     stroke = 3
     cy = y + 8
 
-    extra_gap_factor = 0.8
-    total_gaps = 14 + 2 * extra_gap_factor
-    pitch = usable_width / total_gaps
-    big_gap = extra_gap_factor * pitch
-
-    centers = []
-    x_cursor = start_x
-    for idx in range(15):
-        centers.append(x_cursor)
-        if idx < 14:
-            x_cursor += pitch
-            if idx in (4, 9):
-                x_cursor += big_gap
+    centers = np.empty(15, dtype=np.int64) if np is not None else [0] * 15
+    _compute_pip_centers(start_x, usable_width, 0.8, centers)
 
     # Fill selected energy blips in blue (1-indexed positions)
     energy_blips_raw = str(character_data.get('energyblips') or "").strip()
@@ -427,11 +798,30 @@ def draw_bottom_row(draw, text_left, bottom_boundary, text_right, character_data
             continue
 
     blue = (0, 158, 228, 255)
+    inset = 2
+    if np is not None and maxhp > 0:
+        # Blit cached pip masks into one row buffer per colour, then draw each
+        # row with a single bitmap call instead of up to 30 ellipse calls.
+        ring, disc = _pip_masks(dot_d, stroke, inset)
+        row_left = centers[0] - dot_d // 2
+        row_w = centers[maxhp - 1] - dot_d // 2 - row_left + dot_d + 1
+        ring_row = np.zeros((dot_d + 1, row_w), dtype=np.uint8)
+        fill_row = np.zeros_like(ring_row)
+        for i in range(maxhp):
+            ox = centers[i] - dot_d // 2 - row_left
+            span = slice(ox, ox + dot_d + 1)
+            np.maximum(ring_row[:, span], ring, out=ring_row[:, span])
+            if (i + 1) in energy_positions:
+                np.maximum(fill_row[:, span], disc, out=fill_row[:, span])
+        if energy_positions:
+            draw.bitmap((row_left, cy), Image.fromarray(fill_row, "L"), fill=blue)
+        draw.bitmap((row_left, cy), Image.fromarray(ring_row, "L"), fill=(0, 0, 0, 255))
+        return y
+
     for i in range(maxhp):
-        cx = int(centers[i]) - dot_d // 2
+        cx = centers[i] - dot_d // 2
         bbox = [cx, cy, cx + dot_d, cy + dot_d]
         if (i + 1) in energy_positions:
-            inset = 2
             fill_box = [cx + inset, cy + inset, cx + dot_d - inset, cy + dot_d - inset]
             draw.ellipse(fill_box, fill=blue)
         draw.ellipse(bbox, outline=(0, 0, 0, 255), width=stroke)
@@ -439,6 +829,51 @@ def draw_bottom_row(draw, text_left, bottom_boundary, text_right, character_data
     return y
 
 
+# Token fill colours by arcane suit bit (green=1, blue=2, red=4)
+_SUIT_COLORS = {1: (67, 168, 59, 255), 2: (0, 158, 228, 255), 4: (230, 0, 125, 255)}
+# Suit bits set in each 3-bit colour mask, in drawing order
+_COLS_FOR_MASK = tuple(tuple(b for b in (1, 2, 4) if i & b) for i in range(8))
+
+
+def colors_for_code(code_int):
+    """Suit bits of a colour mask in drawing order; non-int codes have none."""
+    c = code_int if isinstance(code_int, int) else 0
+    return _COLS_FOR_MASK[c & 7]
+
+
+def suit_color(code):
+    """RGBA fill for one suit bit; black for anything else."""
+    return _SUIT_COLORS.get(code, (0, 0, 0, 255))
+
+
+# Arcane token geometry keyed by (id(token_font), value text, line height);
+# token values come from a handful of strings ("2", "X", ...)
+_TOKEN_GEOM_CACHE: Dict[Tuple[int, str, int], Tuple[int, int, int, int]] = {}
+
+
+def token_geometry(draw, value_text, token_font, token_bold_font, line_h):
+    """Return (token_w, token_h, label_dx, label_dy) for one drawn arcane token.
+
+    The label offsets place the bold value text centred inside the token,
+    relative to the token's top-left corner.
+    """
+    key = (id(token_font), value_text, line_h)
+    geom = _TOKEN_GEOM_CACHE.get(key)
+    if geom is None:
+        pad_x, pad_y = 3, 4
+        tb = measure_text(draw, value_text, token_font)
+        tb_bold = measure_text(draw, value_text, token_bold_font)
+        text_w = tb[2] - tb[0]
+        text_h = tb[3] - tb[1]
+        token_h = max(min(line_h - 3, text_h + pad_y * 2), text_h + pad_y * 2 - 1)
+        token_w = max(text_w + pad_x * 2 - 2, token_h - 6)
+        label_dx = (token_w - (tb_bold[2] - tb_bold[0])) // 2 - tb_bold[0]
+        label_dy = (token_h - (tb_bold[3] - tb_bold[1])) // 2 - tb_bold[1]
+        geom = (token_w, token_h, label_dx, label_dy)
+        _TOKEN_GEOM_CACHE[key] = geom
+    return geom
+
+
 def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w, area_bottom, text_draw_override=None):
     """Draw passive, then activated, then arcane abilities, using YAML overrides when present."""
     if not abilities:
@@ -451,22 +886,26 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
     activated: List[Dict[str, Any]] = []
     arcane: List[Dict[str, Any]] = []
 
-    def inch_text_from_yaml(val):
-        if val is None or val == "":
-            return ""
+    def once_text_for(base_obj: Dict[str, Any]) -> str:
         try:
-            if isinstance(val, (int, float)):
-                return f" {int(val)}\""
-            s = normalize_quotes(str(val))
-            if re.fullmatch(r"\d+", s):
-                s = f"{s}\""
-            return f" {s}"
+            if base_obj.get("oncePerTurn"):
+                return " Once Per Turn."
+            if base_obj.get("oncePerGame"):
+                return " Once Per Game."
         except Exception:
-            return ""
-
-    def build_from_yaml(name: str, base_obj: Dict[str, Any], ydef: Dict[str, Any]):
-        t = (ydef.get("type") or "").strip().lower()
-        if t == "activated":
+            pass
+        return ""
+
+    def add_passive(name: str, a: Dict[str, Any], ydef: Dict[str, Any] | None):
+        # Passive text always comes from the JSON entry; only once-per flags apply
+        passive.append({
+            "name": name,
+            "description": ensure_period(normalize_quotes(a.get("description") or a.get("text") or "")),
+            "once_text": once_text_for(a),
+        })
+
+    def add_activated(name: str, a: Dict[str, Any], ydef: Dict[str, Any] | None):
+        if ydef:
             activated.append({
                 "name": name,
                 "cost": ydef.get("cost"),
@@ -477,10 +916,20 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
                 # Some activated abilities can have a catastrophe in YAML
                 "catastrophe": normalize_quotes(ydef.get("catastrophe") or ""),
             })
-        elif t == "arcane":
-            outcomes_src = ydef.get("arcaneOutcomes") or []
-            outcomes: List[Dict[str, Any]] = []
-            for item in outcomes_src:
+        else:
+            activated.append({
+                "name": name,
+                "cost": a.get("energyCost"),
+                "range_txt": inch_text_from_yaml(a.get("range")),
+                "pulse": bool(a.get("pulse")),
+                "tail": normalize_quotes(a.get("tail") or ""),
+                "description": ensure_period(normalize_quotes(a.get("description") or a.get("text") or "")),
+            })
+
+    def add_arcane(name: str, a: Dict[str, Any], ydef: Dict[str, Any] | None):
+        outcomes: List[Dict[str, Any]] = []
+        if ydef:
+            for item in ydef.get("arcaneOutcomes") or []:
                 if not isinstance(item, str):
                     continue
                 vtxt, mask, desc = parse_yaml_outcome(item)
@@ -506,77 +955,47 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
                 "ArcaneOutcome": outcomes,
             })
         else:
-            # Passive: include once-per flags if present on base_obj
-            once_text = ""
-            try:
-                if base_obj.get("oncePerTurn"):
-                    once_text = " Once Per Turn."
-                elif base_obj.get("oncePerGame"):
-                    once_text = " Once Per Game."
-            except Exception:
-                once_text = ""
-            passive.append({
+            for item in a.get("ArcaneOutcome") or []:
+                if not isinstance(item, dict):
+                    continue
+                outcomes.append({
+                    "cardValueRequirement": item.get("cardValueRequirement"),
+                    "cardColourRequirement": item.get("cardColourRequirement", 0),
+                    "outcomeText": ensure_period(normalize_quotes(item.get("outcomeText") or "")),
+                    "catastropheOutcome": bool(item.get("catastropheOutcome")),
+                })
+            arcane.append({
                 "name": name,
-                "description": ensure_period(normalize_quotes(base_obj.get("description") or base_obj.get("text") or "")),
-                "once_text": once_text,
+                "cost": a.get("energyCost"),
+                "range_txt": inch_text_from_yaml(a.get("range")),
+                "pulse": bool(a.get("pulse")),
+                "tail": normalize_quotes(a.get("tail") or ""),
+                "ArcaneOutcome": outcomes,
             })
 
+    dispatch = {"passive": add_passive, "activated": add_activated, "arcane": add_arcane}
+
+    # Classify each ability once, then hand it to the matching bucket builder.
+    # YAML definitions decide the kind when present (unknown types are passive);
+    # otherwise the JSON energy cost and arcane outcomes decide it.
     for a in abilities:
         name = normalize_quotes(a.get("name", "Unnamed"))
         ydef = yaml_map.get(norm_key(name)) if yaml_map else None
         if ydef:
-            build_from_yaml(ydef.get("__name", name), a, ydef)
+            name = ydef.get("__name", name)
+            kind = (ydef.get("type") or "").strip().lower()
+        elif a.get("energyCost") is None:
+            kind = "passive"
+        elif a.get("ArcaneOutcome"):
+            kind = "arcane"
         else:
-            energy = a.get("energyCost")
-            if energy is None:
-                # Passive w/ optional once-per flags from JSON
-                once_text = ""
-                try:
-                    if a.get("oncePerTurn"):
-                        once_text = " Once Per Turn."
-                    elif a.get("oncePerGame"):
-                        once_text = " Once Per Game."
-                except Exception:
-                    once_text = ""
-                passive.append({
-                    "name": name,
-                    "description": ensure_period(normalize_quotes(a.get("description") or a.get("text") or "")),
-                    "once_text": once_text,
-                })
-            else:
-                ao = a.get("ArcaneOutcome") or []
-                if ao:
-                    outs: List[Dict[str, Any]] = []
-                    for item in ao:
-                        if not isinstance(item, dict):
-                            continue
-                        outs.append({
-                            "cardValueRequirement": item.get("cardValueRequirement"),
-                            "cardColourRequirement": item.get("cardColourRequirement", 0),
-                            "outcomeText": ensure_period(normalize_quotes(item.get("outcomeText") or "")),
-                            "catastropheOutcome": bool(item.get("catastropheOutcome")),
-                        })
-                    arcane.append({
-                        "name": name,
-                        "cost": energy,
-                        "range_txt": inch_text_from_yaml(a.get("range")),
-                        "pulse": bool(a.get("pulse")),
-                        "tail": normalize_quotes(a.get("tail") or ""),
-                        "ArcaneOutcome": outs,
-                    })
-                else:
-                    activated.append({
-                        "name": name,
-                        "cost": energy,
-                        "range_txt": inch_text_from_yaml(a.get("range")),
-                        "pulse": bool(a.get("pulse")),
-                        "tail": normalize_quotes(a.get("tail") or ""),
-                        "description": ensure_period(normalize_quotes(a.get("description") or a.get("text") or "")),
-                    })
+            kind = "activated"
+        dispatch.get(kind, add_passive)(name, a, ydef)
 
     title_size = 24
     body_size = 23
     min_size = 12
+    line_gap = 8
 
     def compose_title_parts(a):
         """Return (base_text, tail_text) where tail is italic-friendly and smaller.
@@ -611,40 +1030,60 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
                 return o
         return None
 
-    def measure(total_title_size, total_body_size):
+    def token_value(val):
+        return str(val) if (isinstance(val, (int, float)) and val != 0) else (val if isinstance(val, str) else 'X')
+
+    def catastrophe_line(text):
+        text = (text or '').strip()
+        return f"Catastrophe: {ensure_period(text)}" if text else ""
+
+    # Flatten the buckets into parallel per-field columns once: measure() runs
+    # several times while sizing fonts, and the draw pass reuses the same text
+    p_labels = [f"{a.get('name', 'Unnamed')}: " for a in passive]
+    p_fulls = [f"{label}{a.get('description', '') or ''}".strip() for label, a in zip(p_labels, passive)]
+    p_tails = [(a.get('once_text') or '').rstrip() for a in passive]
+
+    act_titles = [compose_title_parts(a) for a in activated]
+    act_descs = [a.get('description', '') or '' for a in activated]
+    act_catas = [catastrophe_line(a.get('catastrophe')) for a in activated]
+
+    arc_titles = [compose_title_parts(a) for a in arcane]
+    arc_subtexts = [(a.get('subtext') or '').strip() for a in arcane]
+    # (token value, colour mask, description) per non-catastrophe outcome
+    arc_outcomes = [
+        [
+            (token_value(nc.get('cardValueRequirement')), nc.get('cardColourRequirement', 0), (nc.get('outcomeText') or '').strip())
+            for nc in non_cat_outcomes(a.get('ArcaneOutcome'))
+        ]
+        for a in arcane
+    ]
+    arc_catas = []
+    for a in arcane:
+        cata = first_cata(a.get('ArcaneOutcome'))
+        arc_catas.append(f"Catastrophe: {ensure_period((cata.get('outcomeText') or '').strip())}" if cata else "")
+
+    def measure(total_title_size, total_body_size, limit=None):
+        # With a limit, stop after the first ability that passes it: the fit
+        # search only asks whether the layout fits, and y never decreases.
         y = area_y
         title_font = get_font(total_title_size, bold=True)
         body_font = get_font(total_body_size, bold=False)
-        line_gap = 8
-        line_h = draw.textbbox((0, 0), "Ag", font=body_font)[3]
+        line_h = font_line_height(draw, body_font)
 
-        def colors_for_code(code_int):
-            try:
-                c = int(code_int or 0)
-            except Exception:
-                c = 0
-            cols = []
-            if c & 1:
-                cols.append(1)
-            if c & 2:
-                cols.append(2)
-            if c & 4:
-                cols.append(4)
-            return cols
+        # Token geometry inputs only depend on the body font
+        pad_x = 3
+        token_font_size = max(12, int(getattr(body_font, 'size', 18) - 2))
+        token_font = get_font(token_font_size, bold=False)
+        punct_w = text_width(body_font, ", ")
+        or_w = text_width(body_font, " or ")
+        colon_w = text_width(body_font, ": ")
 
         def token_width_sequence(val_text, color_code):
             # Mirror draw_token_sequence geometry with a slightly smaller token font
-            pad_x = 3
-            token_font_size = max(12, int(getattr(body_font, 'size', 18) - 2))
-            token_font = get_font(token_font_size, bold=False)
-            
-            punct_w = draw.textbbox((0, 0), ", ", font=body_font)[2]
-            or_w = draw.textbbox((0, 0), " or ", font=body_font)[2]
-            colon_w = draw.textbbox((0, 0), ": ", font=body_font)[2]
             cols = colors_for_code(color_code)
             
             if not cols:
-                return draw.textbbox((0, 0), f"{val_text}: ", font=body_font)[2]
+                return text_width(body_font, f"{val_text}: ")
             
             # Split value_text by " or " to handle multiple values like "2 or 3"
             values = [v.strip() for v in val_text.split(" or ")]
@@ -653,7 +1092,7 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
             if len(cols) == 1 and len(values) > 1:
                 width = 0
                 for i, val in enumerate(values):
-                    tb = draw.textbbox((0, 0), val, font=token_font)
+                    tb = measure_text(draw, val, token_font)
                     text_w = tb[2] - tb[0]
                     token_h_est = max(min(line_h - 3, (tb[3] - tb[1]) + 8), (tb[3] - tb[1]) + 6)
                     token_w = max(text_w + pad_x * 2 - 2, token_h_est - 6)
@@ -664,7 +1103,7 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
                 return width
             else:
                 # Original logic: one token per color
-                tb = draw.textbbox((0, 0), val_text, font=token_font)
+                tb = measure_text(draw, val_text, token_font)
                 text_w = tb[2] - tb[0]
                 token_h_est = max(min(line_h - 3, (tb[3] - tb[1]) + 8), (tb[3] - tb[1]) + 6)
                 token_w = max(text_w + pad_x * 2 - 2, token_h_est - 6)
@@ -680,152 +1119,142 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
                 return width
 
         # Passive
-        for a in passive:
-            label = f"{a.get('name', 'Unnamed')}: "
-            desc = (a.get('description', '') or '')
-            full = f"{label}{desc}".strip()
+        for full, tail in zip(p_fulls, p_tails):
             lines = wrap_text(draw, full, body_font, area_w)
             last_w = 0
             last_h = 0
             for idx, line in enumerate(lines):
-                lb = draw.textbbox((0, 0), line, font=body_font)
+                lb = measure_text(draw, line, body_font)
                 y += (lb[3] - lb[1]) + 2
                 if idx == len(lines) - 1:
                     last_w = lb[2] - lb[0]
                     last_h = lb[3] - lb[1]
-            # Measure optional italic once-per tail
-            tail = a.get('once_text') or ''
-            # Preserve leading space so it doesn't butt up against the final word
-            tail = tail.rstrip()
+            # Measure optional italic once-per tail (leading space preserved so
+            # it doesn't butt up against the final word)
             if tail:
                 italic_body = get_font(total_body_size, italic=True)
                 remaining = max(0, area_w - last_w)
-                if draw.textbbox((0, 0), tail, font=italic_body)[2] <= remaining:
+                if text_width(italic_body, tail) <= remaining:
                     # Fits on same line: no extra height
                     pass
                 else:
                     # Will wrap to at least one new line
                     for ln in wrap_text(draw, tail, italic_body, area_w):
-                        lb = draw.textbbox((0, 0), ln, font=italic_body)
+                        lb = measure_text(draw, ln, italic_body)
                         y += (lb[3] - lb[1]) + 2
             y += line_gap
+            if limit is not None and y > limit:
+                return y
         if passive and (activated or arcane):
             y += 6
 
         # Activated
-        for a in activated:
-            base_text, _tail = compose_title_parts(a)
-            nb = draw.textbbox((0, 0), base_text, font=title_font)
+        for (base_text, _tail), desc, c_full in zip(act_titles, act_descs, act_catas):
+            nb = measure_text(draw, base_text, title_font)
             y += (nb[3] - nb[1]) + 4
-            desc = a.get('description', '') or ''
             for line in wrap_text(draw, desc, body_font, area_w):
-                lb = draw.textbbox((0, 0), line, font=body_font)
+                lb = measure_text(draw, line, body_font)
                 y += (lb[3] - lb[1]) + 2
             # Optional catastrophe for activated from YAML
-            c_text = (a.get('catastrophe') or '').strip()
-            if c_text:
-                c_full = f"Catastrophe: {ensure_period(c_text)}"
+            if c_full:
                 for line in wrap_text(draw, c_full, body_font, area_w):
-                    lb = draw.textbbox((0, 0), line, font=body_font)
+                    lb = measure_text(draw, line, body_font)
                     y += (lb[3] - lb[1]) + 2
             y += line_gap
+            if limit is not None and y > limit:
+                return y
         if activated and arcane:
             y += 6
 
         # Arcane
-        for a in arcane:
-            base_text, _tail = compose_title_parts(a)
-            nb = draw.textbbox((0, 0), base_text, font=title_font)
+        for (base_text, _tail), subtext, outcomes, c_text_full in zip(arc_titles, arc_subtexts, arc_outcomes, arc_catas):
+            nb = measure_text(draw, base_text, title_font)
             y += (nb[3] - nb[1]) + 4
             # Optional subtext (italic), before outcomes
-            subtext = (a.get('subtext') or '').strip()
             if subtext:
                 italic_body = get_font(total_body_size, italic=True)
                 for line in wrap_text(draw, subtext, italic_body, area_w):
-                    lb = draw.textbbox((0, 0), line, font=italic_body)
+                    lb = measure_text(draw, line, italic_body)
                     y += (lb[3] - lb[1]) + 2
-            ao_list = a.get('ArcaneOutcome') or []
-            non_cats = non_cat_outcomes(ao_list)
-            cata = first_cata(ao_list)
-            for nc in non_cats:
-                val = nc.get('cardValueRequirement')
-                token_val = str(val) if (isinstance(val, (int, float)) and val != 0) else (val if isinstance(val, str) else 'X')
-                token_w = token_width_sequence(token_val, nc.get('cardColourRequirement', 0))
-                desc_text = (nc.get('outcomeText') or '').strip()
+            for token_val, colour, desc_text in outcomes:
+                token_w = token_width_sequence(token_val, colour)
                 # First line with reduced width
                 words = desc_text.split()
-                first_line = ""
                 max_first = max(10, area_w - token_w)
-                for w in words:
-                    test = (first_line + " " + w).strip()
-                    if draw.textbbox((0, 0), test, font=body_font)[2] <= max_first or not first_line:
-                        first_line = test
-                    else:
-                        break
+                first_line = " ".join(words[:first_line_word_count(body_font, words, max_first)])
                 if first_line:
-                    lb = draw.textbbox((0, 0), first_line, font=body_font)
+                    lb = measure_text(draw, first_line, body_font)
                     y += (lb[3] - lb[1]) + 2
                 remaining = desc_text[len(first_line):].lstrip()
                 for cont in wrap_text(draw, remaining, body_font, area_w):
-                    lb = draw.textbbox((0, 0), cont, font=body_font)
+                    lb = measure_text(draw, cont, body_font)
                     y += (lb[3] - lb[1]) + 2
-            if cata:
-                c_text_full = f"Catastrophe: {(cata.get('outcomeText') or '').strip()}"
+            if c_text_full:
                 for line in wrap_text(draw, c_text_full, body_font, area_w):
-                    lb = draw.textbbox((0, 0), line, font=body_font)
+                    lb = measure_text(draw, line, body_font)
                     y += (lb[3] - lb[1]) + 2
             y += line_gap
+            if limit is not None and y > limit:
+                return y
         return y
 
-    while True:
-        needed = measure(title_size, body_size)
-        if needed <= area_bottom - 2 or (title_size <= min_size and body_size <= min_size):
-            break
-        title_size = max(min_size, title_size - 1)
-        body_size = max(min_size, body_size - 1)
+    # Candidate (title, body) size pairs, largest first, shrinking both together
+    size_steps = [(title_size, body_size)]
+    while size_steps[-1][0] > min_size or size_steps[-1][1] > min_size:
+        t, b = size_steps[-1]
+        size_steps.append((max(min_size, t - 1), max(min_size, b - 1)))
+
+    # Most cards fit at full size; otherwise the needed height shrinks
+    # monotonically with the sizes, so bisect for the largest pair that fits.
+    limit = area_bottom - 2
+    lo, hi = 0, len(size_steps) - 1
+    if measure(*size_steps[0], limit=limit) > limit:
+        lo = 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if measure(*size_steps[mid], limit=limit) <= limit:
+                hi = mid
+            else:
+                lo = mid + 1
+    title_size, body_size = size_steps[lo]
 
     y = area_y
     title_font = get_font(title_size, bold=True)
     body_font = get_font(body_size, bold=False)
     title_italic_font = get_font(max(min_size, title_size - 4), italic=True)
     body_italic_font = get_font(body_size, italic=True)
-    line_gap = 8
 
     label_bold = get_font(body_size, bold=True)
-    for a in passive:
-        label = f"{a.get('name', 'Unnamed')}: "
-        desc = (a.get('description', '') or '')
-        full = f"{label}{desc}".strip()
+    for label, full, tail in zip(p_labels, p_fulls, p_tails):
         lines = wrap_text(draw, full, body_font, area_w)
         last_w = 0
         last_h = 0
         last_y_start = y
         if lines:
             first = lines[0]
-            label_w = draw.textbbox((0, 0), label, font=label_bold)[2]
-            first_w = draw.textbbox((0, 0), first, font=body_font)[2]
+            label_w = text_width(label_bold, label)
+            first_w = text_width(body_font, first)
             if label_w <= first_w:
                 # Draw label and the remainder of the first line with styling
                 draw_text_with_special_symbols(text_draw, area_x, y, label, label_bold, (0, 0, 0, 255))
                 draw_styled_text(text_draw, area_x + label_w, y, first[len(label):], body_font, label_bold, (0, 0, 0, 255))
             else:
                 draw_styled_text(text_draw, area_x, y, first, body_font, label_bold, (0, 0, 0, 255))
-            lb = draw.textbbox((0, 0), first, font=body_font)
+            lb = measure_text(draw, first, body_font)
             y += (lb[3] - lb[1]) + 2
             last_w = lb[2] - lb[0]
             last_h = lb[3] - lb[1]
             last_y_start = y - last_h - 2
         for line in lines[1:]:
             draw_styled_text(text_draw, area_x, y, line, body_font, label_bold, (0, 0, 0, 255))
-            lb = draw.textbbox((0, 0), line, font=body_font)
+            lb = measure_text(draw, line, body_font)
             y += (lb[3] - lb[1]) + 2
             last_w = lb[2] - lb[0]
             last_h = lb[3] - lb[1]
             last_y_start = y - last_h - 2
         # Draw optional italic once-per tail appended
-        tail = (a.get('once_text') or '').rstrip()
         if tail:
-            tail_w = draw.textbbox((0, 0), tail, font=body_italic_font)[2]
+            tail_w = text_width(body_italic_font, tail)
             remaining = max(0, area_w - last_w)
             if tail_w <= remaining and last_h > 0:
                 # Draw on the same last line, immediately after text
@@ -833,68 +1262,44 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
             else:
                 # New line, left-aligned
                 draw_text_with_special_symbols(text_draw, area_x, y, tail, body_italic_font, (0, 0, 0, 255), italic=True)
-                lb = draw.textbbox((0, 0), tail, font=body_italic_font)
+                lb = measure_text(draw, tail, body_italic_font)
                 y += (lb[3] - lb[1]) + 2
         y += line_gap
     if passive and (activated or arcane):
         draw.line([area_x + 12, y, area_x + area_w - 12, y], fill=(0, 0, 0, 255), width=1)
         y += 6
 
-    for a in activated:
-        base_text, tail_text = compose_title_parts(a)
+    for (base_text, tail_text), desc, c_full in zip(act_titles, act_descs, act_catas):
         draw_text_with_special_symbols(text_draw, area_x, y, base_text, title_font, (0, 0, 0, 255))
-        nb = draw.textbbox((0, 0), base_text, font=title_font)
+        nb = measure_text(draw, base_text, title_font)
         # Draw tail in smaller italics on the same baseline
         if tail_text:
             tx = area_x + (nb[2] - nb[0])
             draw_text_with_special_symbols(text_draw, tx, y, tail_text, title_italic_font, (0, 0, 0, 255), italic=True)
-            nb = draw.textbbox((0, 0), base_text, font=title_font)
+            nb = measure_text(draw, base_text, title_font)
         y += (nb[3] - nb[1]) + 4
-        desc = a.get('description', '') or ''
         for line in wrap_text(draw, desc, body_font, area_w):
             draw_styled_text(text_draw, area_x, y, line, body_font, label_bold, (0, 0, 0, 255))
-            lb = draw.textbbox((0, 0), line, font=body_font)
+            lb = measure_text(draw, line, body_font)
             y += (lb[3] - lb[1]) + 2
         # Draw catastrophe line for activated if present
-        c_text = (a.get('catastrophe') or '').strip()
-        if c_text:
-            c_full = f"Catastrophe: {ensure_period(c_text)}"
+        if c_full:
             for line in wrap_text(draw, c_full, body_font, area_w):
                 draw_styled_text(text_draw, area_x, y, line, body_font, label_bold, (0, 0, 0, 255))
-                lb = draw.textbbox((0, 0), line, font=body_font)
+                lb = measure_text(draw, line, body_font)
                 y += (lb[3] - lb[1]) + 2
         y += line_gap
     if activated and arcane:
         draw.line([area_x + 12, y, area_x + area_w - 12, y], fill=(0, 0, 0, 255), width=1)
         y += 6
 
-    def suit_color(code):
-        mapping = {1: (67, 168, 59, 255), 2: (0, 158, 228, 255), 4: (230, 0, 125, 255)}
-        try:
-            return mapping[int(code)]
-        except Exception:
-            return (0, 0, 0, 255)
-
-    def colors_for_code(code_int):
-        try:
-            c = int(code_int or 0)
-        except Exception:
-            c = 0
-        cols = []
-        if c & 1:
-            cols.append(1)
-        if c & 2:
-            cols.append(2)
-        if c & 4:
-            cols.append(4)
-        return cols
-
     shapes_draw = draw
     def draw_token_sequence(x, y, value_text, color_code, font):
-        # Slightly smaller/thinner tokens (shrink background without shrinking text)
-        pad_x, pad_y, radius = 3, 4, 5
+        # Slightly smaller/thinner tokens (shrink background without shrinking
+        # text); see token_geometry for the padding
+        radius = 5
         white = (255, 255, 255, 255)
-        line_h = shapes_draw.textbbox((0, 0), "Ag", font=font)[3]
+        line_h = font_line_height(shapes_draw, font)
         token_font_size = max(12, int(getattr(font, 'size', 18) - 2))
         token_font = get_font(token_font_size, bold=False)
         token_bold_font = get_font(token_font_size, bold=True)
@@ -903,136 +1308,187 @@ def layout_and_draw_abilities(draw, abilities, yaml_map, area_x, area_y, area_w,
         if not cols:
             simple = f"{value_text}: "
             # Punctuation/text belongs on the text layer for glow
-            text_draw.text((x, y), simple, fill=(0, 0, 0, 255), font=token_bold_font)
-            sb = text_draw.textbbox((0, 0), simple, font=token_bold_font)
-            return x + (sb[2] - sb[0])
+            draw_cached_text(text_draw, (x, y), simple, token_bold_font, (0, 0, 0, 255))
+            return x + text_width(token_bold_font, simple)
         
         # Split value_text by " or " to handle multiple values like "2 or 3"
         values = [v.strip() for v in value_text.split(" or ")]
-        
+        black = (0, 0, 0, 255)
+        # Lay out the whole sequence first, then draw all token shapes and all
+        # labels in two passes: (rect, fill) and (xy, text, font, fill)
+        rects = []
+        labels = []
+
         # If we have a single color and multiple values, draw multiple tokens of that color
         if len(cols) == 1 and len(values) > 1:
             c = cols[0]
             for i, val in enumerate(values):
-                # Calculate token size for this value
-                tb = shapes_draw.textbbox((0, 0), val, font=token_font)
-                tb_bold = shapes_draw.textbbox((0, 0), val, font=token_bold_font)
-                text_w = tb[2] - tb[0]
-                text_h = tb[3] - tb[1]
-                token_h = max(min(line_h - 3, text_h + pad_y * 2), text_h + pad_y * 2 - 1)
-                token_w = max(text_w + pad_x * 2 - 2, token_h - 6)
+                # Token size for this value, with the text centred inside
+                token_w, token_h, label_dx, label_dy = token_geometry(shapes_draw, val, token_font, token_bold_font, line_h)
                 ty = y + (line_h - token_h) // 2
-                
-                # Draw token
-                rect = [x, ty, x + token_w, ty + token_h]
-                try:
-                    shapes_draw.rounded_rectangle(rect, radius=radius, fill=suit_color(c))
-                except Exception:
-                    shapes_draw.rectangle(rect, fill=suit_color(c))
-                
-                # Center text inside token
-                tx = x + (token_w - (tb_bold[2] - tb_bold[0])) // 2 - tb_bold[0]
-                ty_text = ty + (token_h - (tb_bold[3] - tb_bold[1])) // 2 - tb_bold[1]
-                text_draw.text((tx, ty_text), val, fill=white, font=token_bold_font)
+                rects.append(([x, ty, x + token_w, ty + token_h], suit_color(c)))
+                labels.append(((x + label_dx, ty + label_dy), val, token_bold_font, white))
                 x += token_w
-                
+
                 # Add " or " between tokens
                 if i < len(values) - 1:
-                    text_draw.text((x, y), " or ", fill=(0, 0, 0, 255), font=font)
-                    x += text_draw.textbbox((0, 0), " or ", font=font)[2]
+                    labels.append(((x, y), " or ", font, black))
+                    x += text_width(font, " or ")
         else:
             # Original logic: one token per color
-            tb = shapes_draw.textbbox((0, 0), value_text, font=token_font)
-            tb_bold = shapes_draw.textbbox((0, 0), value_text, font=token_bold_font)
-            text_w = tb[2] - tb[0]
-            text_h = tb[3] - tb[1]
-            token_h = max(min(line_h - 3, text_h + pad_y * 2), text_h + pad_y * 2 - 1)
-            token_w = max(text_w + pad_x * 2 - 2, token_h - 6)
+            token_w, token_h, label_dx, label_dy = token_geometry(shapes_draw, value_text, token_font, token_bold_font, line_h)
             ty = y + (line_h - token_h) // 2
-            
+
             for i, c in enumerate(cols):
-                rect = [x, ty, x + token_w, ty + token_h]
-                try:
-                    shapes_draw.rounded_rectangle(rect, radius=radius, fill=suit_color(c))
-                except Exception:
-                    shapes_draw.rectangle(rect, fill=suit_color(c))
-                # Center text precisely inside the token using the token_font
-                tx = x + (token_w - (tb_bold[2] - tb_bold[0])) // 2 - tb_bold[0]
-                ty_text = ty + (token_h - (tb_bold[3] - tb_bold[1])) // 2 - tb_bold[1]
-                text_draw.text((tx, ty_text), value_text, fill=white, font=token_bold_font)
+                rects.append(([x, ty, x + token_w, ty + token_h], suit_color(c)))
+                labels.append(((x + label_dx, ty + label_dy), value_text, token_bold_font, white))
                 x += token_w
                 if i < len(cols) - 2:
-                    text_draw.text((x, y), ", ", fill=(0, 0, 0, 255), font=font)
-                    x += text_draw.textbbox((0, 0), ", ", font=font)[2]
+                    labels.append(((x, y), ", ", font, black))
+                    x += text_width(font, ", ")
                 elif i == len(cols) - 2:
-                    text_draw.text((x, y), " or ", fill=(0, 0, 0, 255), font=font)
-                    x += text_draw.textbbox((0, 0), " or ", font=font)[2]
-        
-        text_draw.text((x, y), ": ", fill=(0, 0, 0, 255), font=font)
-        x += text_draw.textbbox((0, 0), ": ", font=font)[2]
+                    labels.append(((x, y), " or ", font, black))
+                    x += text_width(font, " or ")
+
+        labels.append(((x, y), ": ", font, black))
+        x += text_width(font, ": ")
+
+        for rect, fill in rects:
+            try:
+                shapes_draw.rounded_rectangle(rect, radius=radius, fill=fill)
+            except Exception:
+                shapes_draw.rectangle(rect, fill=fill)
+        for xy, label, label_font, fill in labels:
+            draw_cached_text(text_draw, xy, label, label_font, fill)
         return x
 
-    for a in arcane:
-        base_text, tail_text = compose_title_parts(a)
+    for (base_text, tail_text), subtext, outcomes, c_text_full in zip(arc_titles, arc_subtexts, arc_outcomes, arc_catas):
         draw_text_with_special_symbols(text_draw, area_x, y, base_text, title_font, (0, 0, 0, 255))
-        nb = draw.textbbox((0, 0), base_text, font=title_font)
+        nb = measure_text(draw, base_text, title_font)
         if tail_text:
             tx = area_x + (nb[2] - nb[0])
             draw_text_with_special_symbols(text_draw, tx, y, tail_text, title_italic_font, (0, 0, 0, 255), italic=True)
         y += (nb[3] - nb[1]) + 4
         # Arcane subtext before outcomes
-        subtext = (a.get('subtext') or '').strip()
         if subtext:
             for line in wrap_text(draw, subtext, body_italic_font, area_w):
                 draw_text_with_special_symbols(text_draw, area_x, y, line, body_italic_font, (0, 0, 0, 255), italic=True)
-                lb = draw.textbbox((0, 0), line, font=body_italic_font)
+                lb = measure_text(draw, line, body_italic_font)
                 y += (lb[3] - lb[1]) + 2
-        ao_list = a.get('ArcaneOutcome') or []
-        non_cats = non_cat_outcomes(ao_list)
-        cata = first_cata(ao_list)
-        for nc in non_cats:
-            val = nc.get('cardValueRequirement')
-            token_val = str(val) if (isinstance(val, (int, float)) and val != 0) else (val if isinstance(val, str) else 'X')
-            start_after_tokens_x = draw_token_sequence(area_x, y, token_val, nc.get('cardColourRequirement', 0), body_font)
+        for token_val, colour, desc_text in outcomes:
+            start_after_tokens_x = draw_token_sequence(area_x, y, token_val, colour, body_font)
             available_first = area_w - (start_after_tokens_x - area_x)
-            desc_text = (nc.get('outcomeText') or '').strip()
             words = desc_text.split()
-            first_line = ""
-            for w in words:
-                test = (first_line + " " + w).strip()
-                if draw.textbbox((0, 0), test, font=body_font)[2] <= available_first or not first_line:
-                    first_line = test
-                else:
-                    break
+            first_line = " ".join(words[:first_line_word_count(body_font, words, available_first)])
             if first_line:
                 draw_styled_text(text_draw, start_after_tokens_x, y, first_line, body_font, label_bold, (0, 0, 0, 255))
-                lb = draw.textbbox((0, 0), first_line, font=body_font)
+                lb = measure_text(draw, first_line, body_font)
                 y += (lb[3] - lb[1]) + 2
             remaining = desc_text[len(first_line):].lstrip()
             for cont in wrap_text(draw, remaining, body_font, area_w):
                 draw_styled_text(text_draw, area_x, y, cont, body_font, label_bold, (0, 0, 0, 255))
-                lb = draw.textbbox((0, 0), cont, font=body_font)
+                lb = measure_text(draw, cont, body_font)
                 y += (lb[3] - lb[1]) + 2
-        if cata:
-            c_text_full = f"Catastrophe: {ensure_period((cata.get('outcomeText') or '').strip())}"
+        if c_text_full:
             for line in wrap_text(draw, c_text_full, body_font, area_w):
                 draw_styled_text(text_draw, area_x, y, line, body_font, label_bold, (0, 0, 0, 255))
-                lb = draw.textbbox((0, 0), line, font=body_font)
+                lb = measure_text(draw, line, body_font)
                 y += (lb[3] - lb[1]) + 2
         y += line_gap
     return y
 
 
-def create_left_side_character_card(input_image_path, character_data, output_path):
-    """Add left side text overlay to an existing wide character card image."""
+# Reusable transparent text layers (and their Draw objects) keyed by card size
+_TEXT_LAYERS: Dict[Tuple[int, int], Tuple[Image.Image, ImageDraw.ImageDraw]] = {}
+
+
+def _cleared_text_layer(size):
+    """Return a cleared (layer, draw) pair for a card of this size.
+
+    Cards in a batch share dimensions, so the RGBA buffer is allocated once per
+    process and wiped between cards rather than reallocated. Each worker
+    process keeps its own layers.
+    """
+    entry = _TEXT_LAYERS.get(size)
+    if entry is None:
+        layer = Image.new("RGBA", size, (255, 255, 255, 0))
+        entry = _TEXT_LAYERS[size] = (layer, ImageDraw.Draw(layer))
+    else:
+        entry[0].paste((255, 255, 255, 0), (0, 0) + size)
+    return entry
+
+
+# Cards are intermediates for the PDF step, so favour encode speed over size:
+# zlib level 1 encodes several times faster than the default level 6
+_PNG_SAVE_KWARGS = {"compress_level": 1, "optimize": False}
+
+# Margin kept around the text bounding box so the MaxFilter + GaussianBlur
+# glow is not clipped
+_GLOW_PAD = 16
+# Glow opacity lookup, capped at ~50%; applied with Image.point
+_GLOW_LUT = [int(min(255, a) * 0.5) for a in range(256)]
+
+
+@lru_cache(maxsize=16)
+def _load_overlay(path, mtime, size):
+    """Return the RGBA overlay at path fitted to size, cached per (path, mtime, size).
+
+    Overlays are shared by several cards, so the decode and LANCZOS resize run
+    once per process rather than once per card. Callers must not draw on it.
+    """
+    overlay = Image.open(path).convert("RGBA")
+    if overlay.size != size:
+        # Use a broadly compatible resample method
+        resample = getattr(Image, 'LANCZOS', getattr(Image, 'BICUBIC', 3))
+        # Pillow>=9 prefers Image.Resampling
+        if hasattr(Image, 'Resampling'):
+            resample = Image.Resampling.LANCZOS
+        overlay = overlay.resize(size, resample)
+    return overlay
+
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _overlay_candidate_paths(name: str):
+    base = os.path.join(_SCRIPT_DIR, name)
+    yield base
+    # Fix common typo: trailing 'p' in .pngp
+    if name.lower().endswith('.pngp'):
+        yield os.path.join(_SCRIPT_DIR, name[:-1])
+    # If no extension, try .png
+    if '.' not in os.path.basename(name):
+        yield os.path.join(_SCRIPT_DIR, name + '.png')
+    # Try common case variants
+    for ext in ['.png', '.PNG', '.webp', '.jpg', '.jpeg']:
+        if not name.lower().endswith(ext):
+            yield os.path.join(_SCRIPT_DIR, os.path.splitext(name)[0] + ext)
+
+
+@lru_cache(maxsize=None)
+def _resolve_overlay_path(name: str):
+    """Return the first existing overlay file for name, probed once per process."""
+    for p in _overlay_candidate_paths(name):
+        if os.path.exists(p):
+            return p
+    return None
+
+
+def create_left_side_character_card(input_image_path, character_data, output_path, yaml_map=None):
+    """Add left side text overlay to an existing wide character card image.
+
+    yaml_map is the normalized ability map from load_yaml_abilities; when it is
+    omitted, abilities are laid out from the JSON data alone. output_path may
+    also be a writable binary file object, which receives the PNG bytes.
+    """
     try:
-        img = Image.open(input_image_path).convert("RGBA")
-        # Shapes/lines layer (textless): boxes, dividers, tokens, pips, etc.
-        textless_overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-        draw = ImageDraw.Draw(textless_overlay)
+        # Base cards are opaque and the output is RGB, so work in RGB throughout
+        img = Image.open(input_image_path).convert("RGB")
+        # Shapes/lines (boxes, dividers, tokens, pips, etc.) are all opaque, so
+        # draw them straight onto the card instead of a full-size overlay
+        draw = ImageDraw.Draw(img)
         # Dedicated text layer for all text with optional glow
-        all_text_layer = Image.new("RGBA", img.size, (255, 255, 255, 0))
-        text_draw = ImageDraw.Draw(all_text_layer)
+        all_text_layer, text_draw = _cleared_text_layer(img.size)
 
         # Working area boundaries
         left_boundary, top_boundary, right_boundary, bottom_boundary = 10, 10, 745, 690
@@ -1040,66 +1496,82 @@ def create_left_side_character_card(input_image_path, character_data, output_pat
         text_left = left_boundary + text_margin
         # Increase right-side safety margin slightly to avoid touching the thick border
         text_right = right_boundary - 30
-        text_width = text_right - text_left
+        text_area_w = text_right - text_left
 
         black = (0, 0, 0, 255)
         character_name = character_data.get('name', 'Unknown Character')
 
         # Helper to compute fonts for main + subtitle fitting combined width
-        def pick_name_fonts(main: str, sub: str, max_w: int) -> Tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]:
-            for size in range(48, 12, -1):
+        # Also returns the main name and ", " widths so the caller can place the
+        # comma and subtitle without measuring them again.
+        # Like get_character_name_font, measure at 48, jump to the proportional
+        # estimate and step from there instead of scanning every size.
+        def pick_name_fonts(main: str, sub: str, max_w: int) -> Tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont, int, int]:
+            def widths(size):
                 main_font = get_font(size, bold=True)
                 sub_font = get_font(max(8, int(size * 0.80)), bold=True)
-                w_main = draw.textbbox((0, 0), main, font=main_font)[2]
-                w_comma = draw.textbbox((0, 0), ", ", font=main_font)[2]
-                w_sub = draw.textbbox((0, 0), sub, font=sub_font)[2]
-                if (w_main + w_comma + w_sub) <= max_w:
-                    return main_font, sub_font
-            return get_font(12, bold=True), get_font(10, bold=True)
+                w_main = text_width(main_font, main)
+                w_comma = text_width(main_font, ", ")
+                return main_font, sub_font, w_main, w_comma, w_main + w_comma + text_width(sub_font, sub)
+
+            main_font, sub_font, w_main, w_comma, total = widths(48)
+            if total <= max_w:
+                return main_font, sub_font, w_main, w_comma
+            size = max(13, min(47, int(48 * max_w / total)))
+            fit = widths(size)
+            if fit[4] <= max_w:
+                while size < 47:
+                    bigger = widths(size + 1)
+                    if bigger[4] > max_w:
+                        break
+                    size, fit = size + 1, bigger
+                return fit[:4]
+            while size > 13:
+                size -= 1
+                fit = widths(size)
+                if fit[4] <= max_w:
+                    return fit[:4]
+            main_font = get_font(12, bold=True)
+            return main_font, get_font(10, bold=True), text_width(main_font, main), text_width(main_font, ", ")
 
         # Name (with optional subtitle after comma)
         if ',' in character_name:
             main_name, subtitle = [p.strip() for p in character_name.split(',', 1)]
             # Reserve extra right-side buffer to avoid overlapping faction emblem
-            name_font, subtitle_font = pick_name_fonts(main_name, subtitle, max(0, text_width - 50))
+            name_font, subtitle_font, main_w, comma_w = pick_name_fonts(main_name, subtitle, max(0, text_area_w - 50))
             name_x = text_left
             name_y = top_boundary + text_margin
             test_text = "Ag"
-            main_metrics = draw.textbbox((0, 0), test_text, font=name_font)
-            subtitle_metrics = draw.textbbox((0, 0), test_text, font=subtitle_font)
+            main_metrics = measure_text(draw, test_text, name_font)
+            subtitle_metrics = measure_text(draw, test_text, subtitle_font)
             main_ascent = abs(main_metrics[1])
             subtitle_ascent = abs(subtitle_metrics[1])
             # Lower the subtitle further to sit flush with the main name
             baseline_offset = max(0, main_ascent - subtitle_ascent) + 5
-            text_draw.text((name_x, name_y), main_name, fill=black, font=name_font)
-            main_bbox = draw.textbbox((0, 0), main_name, font=name_font)
-            main_width = main_bbox[2] - main_bbox[0]
-            comma_x = name_x + main_width
-            text_draw.text((comma_x, name_y), ", ", fill=black, font=name_font)
-            comma_w = draw.textbbox((0, 0), ", ", font=name_font)[2]
+            draw_cached_text(text_draw, (name_x, name_y), main_name, name_font, black)
+            comma_x = name_x + main_w
+            draw_cached_text(text_draw, (comma_x, name_y), ", ", name_font, black)
             subtitle_x = comma_x + comma_w
             subtitle_y = name_y + baseline_offset
-            text_draw.text((subtitle_x, subtitle_y), subtitle, fill=black, font=subtitle_font)
+            draw_cached_text(text_draw, (subtitle_x, subtitle_y), subtitle, subtitle_font, black)
             current_y = top_boundary + 60
         else:
             # Apply the same right-side buffer for long single-line names
-            name_font = get_character_name_font(character_name, max(0, text_width - 50), draw)
+            name_font = get_character_name_font(character_name, max(0, text_area_w - 50), draw)
             name_x = text_left
             name_y = top_boundary + text_margin
-            text_draw.text((name_x, name_y), character_name, fill=black, font=name_font)
+            draw_cached_text(text_draw, (name_x, name_y), character_name, name_font, black)
             current_y = top_boundary + 60
 
         # Keywords
         keywords = character_data.get('keywords', '')
         if keywords and str(keywords).strip():
-            formatted = str(keywords).replace(',', ', ').replace(', ,', ',').replace('  ', ' ').strip()
-            while ', ,' in formatted:
-                formatted = formatted.replace(', ,', ',')
-            formatted = formatted.rstrip(', ')
+            # Tidy separators and drop empty entries in one split/join pass
+            formatted = ', '.join(filter(None, (k.strip() for k in str(keywords).split(','))))
             keywords_font = get_font(20, bold=False)
             keywords_y = current_y
-            text_draw.text((name_x, keywords_y), formatted, fill=black, font=keywords_font)
-            kw_bbox = draw.textbbox((0, 0), formatted, font=keywords_font)
+            draw_cached_text(text_draw, (name_x, keywords_y), formatted, keywords_font, black)
+            kw_bbox = measure_text(draw, formatted, keywords_font)
             # Draw version line in the gap between keywords and stats without moving stats down
             try:
                 version_val = character_data.get('version')
@@ -1111,12 +1583,12 @@ def create_left_side_character_card(input_image_path, character_data, output_pat
                 version_font = get_font(15, bold=False)
                 v_text = f"v.{version_int}"
                 v_y = keywords_y + (kw_bbox[3] - kw_bbox[1]) + 6
-                text_draw.text((name_x, v_y), v_text, fill=black, font=version_font)
+                draw_cached_text(text_draw, (name_x, v_y), v_text, version_font, black)
             current_y += (kw_bbox[3] - kw_bbox[1]) + 15
 
         # Stats box
-        stats_area_width = int(text_width * 0.60)
-        stats_x = text_left + (text_width - stats_area_width) // 2
+        stats_area_width = int(text_area_w * 0.60)
+        stats_x = text_left + (text_area_w - stats_area_width) // 2
         stats_y = current_y
         after_stats_y = draw_stats_box(draw, stats_x, stats_y, stats_area_width, character_data, text_draw_override=text_draw)
 
@@ -1132,87 +1604,89 @@ def create_left_side_character_card(input_image_path, character_data, output_pat
         abilities_text_draw = text_draw
         # Allow abilities content to extend slightly further toward the bottom row
         abilities_bottom = bottom_row_top_y + 2
-        layout_and_draw_abilities(draw, character_data.get('Ability', []), ABILITIES_YAML, abilities_x, abilities_y, abilities_w, abilities_bottom, text_draw_override=abilities_text_draw)
-
-        # Composite text on base
-        final_rgba = Image.alpha_composite(img, textless_overlay)
-
-        # Build a subtle white feathered outline behind the ability text
-        try:
-            # Build glow using all text drawn so far
-            text_alpha = all_text_layer.split()[3]
-            expanded = text_alpha.filter(ImageFilter.MaxFilter(3))
-            blurred = expanded.filter(ImageFilter.GaussianBlur(radius=2.4))
-            # Keep subtle but a bit stronger: cap opacity at ~50%
-            faded = blurred.point(lambda a: int(min(255, a) * 0.5))
-            white_glow = Image.new("RGBA", img.size, (255, 255, 255, 0))
-            white_glow.putalpha(faded)
-            # Composite glow first, then the actual ability text
-            final_rgba = Image.alpha_composite(final_rgba, white_glow)
-            final_rgba = Image.alpha_composite(final_rgba, all_text_layer)
-        except Exception:
-            # Fallback: just add text without glow
-            final_rgba = Image.alpha_composite(final_rgba, all_text_layer)
-
-        # Now composite all text (including abilities/glow) onto the base image
-        final_rgba = Image.alpha_composite(img, final_rgba)
+        layout_and_draw_abilities(draw, character_data.get('Ability', []), yaml_map, abilities_x, abilities_y, abilities_w, abilities_bottom, text_draw_override=abilities_text_draw)
+
+        # Text only covers part of the card, so build the glow and composite
+        # within the text bounding box (padded for the blur) instead of over
+        # full-size buffers
+        text_box = all_text_layer.getbbox()
+        if text_box:
+            pad = _GLOW_PAD
+            text_box = (
+                max(0, text_box[0] - pad), max(0, text_box[1] - pad),
+                min(img.width, text_box[2] + pad), min(img.height, text_box[3] + pad),
+            )
+            text_region = all_text_layer.crop(text_box)
+            dest = text_box[:2]
+            # Build a subtle white feathered outline behind the ability text
+            try:
+                # Build glow using all text drawn so far
+                text_alpha = text_region.getchannel("A")
+                expanded = text_alpha.filter(ImageFilter.MaxFilter(3))
+                blurred = expanded.filter(ImageFilter.GaussianBlur(radius=2.4))
+                # Keep subtle but a bit stronger: cap opacity at ~50%
+                faded = blurred.point(_GLOW_LUT)
+                # Blend the glow first, then the actual ability text (in place);
+                # a masked paste is an alpha blend onto the opaque card
+                img.paste((255, 255, 255), dest, faded)
+                img.paste(text_region, dest, text_region)
+            except Exception:
+                # Fallback: just add text without glow
+                img.paste(text_region, dest, text_region)
 
         # Optional: apply a top overlay image if specified for this character
         try:
             overlay_name = character_data.get('overlayImage')
             if isinstance(overlay_name, str) and overlay_name.strip():
-                script_dir = os.path.dirname(os.path.abspath(__file__))
                 raw_name = overlay_name.strip()
-
-                def candidate_paths(name: str):
-                    base = os.path.join(script_dir, name)
-                    yield base
-                    # Fix common typo: trailing 'p' in .pngp
-                    if name.lower().endswith('.pngp'):
-                        yield os.path.join(script_dir, name[:-1])
-                    # If no extension, try .png
-                    if '.' not in os.path.basename(name):
-                        yield os.path.join(script_dir, name + '.png')
-                    # Try common case variants
-                    for ext in ['.png', '.PNG', '.webp', '.jpg', '.jpeg']:
-                        if not name.lower().endswith(ext):
-                            yield os.path.join(script_dir, os.path.splitext(name)[0] + ext)
-
-                resolved_path = None
-                for p in candidate_paths(raw_name):
-                    if os.path.exists(p):
-                        resolved_path = p
-                        break
+                resolved_path = _resolve_overlay_path(raw_name)
 
                 if resolved_path:
                     print(f"Applying overlay: {os.path.basename(resolved_path)}")
-                    top_overlay = Image.open(resolved_path).convert("RGBA")
-                    if top_overlay.size != final_rgba.size:
-                        # Use a broadly compatible resample method
-                        resample = getattr(Image, 'LANCZOS', getattr(Image, 'BICUBIC', 3))
-                        try:
-                            # Pillow>=9 prefers Image.Resampling
-                            from PIL import Image as _IMG
-                            if hasattr(_IMG, 'Resampling'):
-                                resample = _IMG.Resampling.LANCZOS
-                        except Exception:
-                            pass
-                        top_overlay = top_overlay.resize(final_rgba.size, resample)
-                    final_rgba = Image.alpha_composite(final_rgba, top_overlay)
+                    top_overlay = _load_overlay(resolved_path, os.path.getmtime(resolved_path), img.size)
+                    img.paste(top_overlay, (0, 0), top_overlay)
                 else:
                     print(f"Warning: overlayImage specified but not found: {raw_name}")
         except Exception as overlay_err:
             print(f"Warning: failed to apply overlayImage: {overlay_err}")
 
-        final_img = final_rgba.convert("RGB")
-        final_img.save(output_path, "PNG")
-        print(f"Created left side card: {output_path}")
+        img.save(output_path, "PNG", **_PNG_SAVE_KWARGS)
+        if isinstance(output_path, str):
+            print(f"Created left side card: {output_path}")
         return True
     except Exception as e:
         print(f"Error creating left side card: {str(e)}")
         return False
 
 
+def _render_card_task(task):
+    """Process-pool worker: render one card from (input, entry, output, yaml_path).
+
+    Forked workers find the parent's parsed ability map in _YAML_CACHE; spawned
+    ones load it once per process (from the pickle sidecar), not once per card.
+    """
+    input_image_path, entry, output_path, yaml_path = task
+    return create_left_side_character_card(input_image_path, entry, output_path, load_yaml_abilities(yaml_path))
+
+
+def _render_card_bytes_task(task):
+    """Like _render_card_task, but return (ok, png_bytes) for the parent to archive."""
+    input_image_path, entry, output_path, yaml_path = task
+    buf = io.BytesIO()
+    ok = create_left_side_character_card(input_image_path, entry, buf, load_yaml_abilities(yaml_path))
+    return ok, buf.getvalue()
+
+
+def _pool_context():
+    """Prefer fork on Linux so workers inherit the parent's parsed data and caches.
+
+    Elsewhere fork is unavailable or unsafe, so the platform default is used.
+    """
+    if sys.platform.startswith("linux") and "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
 def main():
     # Get the directory of this script
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -1222,6 +1696,9 @@ def main():
     yaml_path = os.path.join(script_dir, 'abilities_strings.yaml')
     input_cards_dir = os.path.join(script_dir, 'generated_wide_cards')
     output_dir = os.path.join(script_dir, 'generated_wide_cards_with_left_text')
+    # 'zip': store every card in one archive instead of one file per card
+    to_zip = len(sys.argv) > 1 and sys.argv[1].lower() == 'zip'
+    zip_path = os.path.join(output_dir, 'cards.zip')
 
     # Check if moonstone_data.json exists
     if not os.path.exists(json_path):
@@ -1237,7 +1714,8 @@ def main():
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
-    # Load the YAML abilities map if available
+    # Load the YAML abilities map once up front: forked workers inherit it, and
+    # the pickle sidecar is fresh for any that have to load it themselves
     load_yaml_abilities(yaml_path)
 
     # Load the JSON data
@@ -1248,8 +1726,8 @@ def main():
         print(f"Error reading moonstone_data.json: {str(e)}")
         sys.exit(1)
 
-    # Process each character
-    successful_cards = 0
+    # Collect each character's card job, then render them in parallel
+    tasks = []
     total_characters = 0
 
     for entry in moonstone_data:
@@ -1269,11 +1747,25 @@ def main():
 
         output_path = os.path.join(output_dir, f"{safe_filename}_wide_card_with_text.png")
 
-        if create_left_side_character_card(input_image_path, entry, output_path):
-            successful_cards += 1
+        tasks.append((input_image_path, entry, output_path, yaml_path))
+
+    # Cards are independent and CPU-bound, so spread them over all cores
+    successful_cards = 0
+    if tasks:
+        workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+            if to_zip:
+                # PNGs are already compressed, so store them without deflate
+                with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as archive:
+                    for task, (ok, png) in zip(tasks, executor.map(_render_card_bytes_task, tasks)):
+                        if ok:
+                            archive.writestr(os.path.basename(task[2]), png)
+                            successful_cards += 1
+            else:
+                successful_cards = sum(executor.map(_render_card_task, tasks))
 
     print(f"\nCompleted! Successfully created {successful_cards} out of {total_characters} character cards with left side text.")
-    print(f"Output directory: {output_dir}")
+    print(f"Output {'archive' if to_zip else 'directory'}: {zip_path if to_zip else output_dir}")
 
 
 if __name__ == "__main__":
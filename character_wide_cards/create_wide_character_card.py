@@ -5,36 +5,38 @@ from character directories onto a 700x1200 black canvas.
 """
 
 import json
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import sys
 
+# Faction string from JSON -> faction symbol filename
+_FACTION_SYMBOL_FILES = {
+    "Commonwealth": "Commonwealth.png",
+    "Dominion": "Dominion.png",
+    "Leshavult": "Leshavault.png",
+    "Shade": "Shades.png",
+    "Commonwealth,Dominion": "Dominion_Commonwealth.png",
+    "Dominion,Commonwealth": "Dominion_Commonwealth.png",
+    "Commonwealth,Leshavult": "Commonwealth_Leshavault.png",
+    "Leshavult,Commonwealth": "Commonwealth_Leshavault.png",
+    "Dominion,Leshavult": "Dominion_Leshavault.png",
+    "Leshavult,Dominion": "Dominion_Leshavault.png",
+    "Dominion,Shade": "Shades_Dominion.png",
+    "Shade,Dominion": "Shades_Dominion.png",
+    "Leshavult,Shade": "Shades_Leshavault.png",
+    "Shade,Leshavult": "Shades_Leshavault.png",
+    "Shade,Commonwealth": "Commonwealth_Shades.png",
+    "Commonwealth,Shade": "Commonwealth_Shades.png"
+}
+
 def get_faction_symbol_filename(faction_string):
     """Convert faction string from JSON to corresponding faction symbol filename"""
     if not faction_string:
         return None
-    
-    # Normalize the faction string and create mapping
-    faction_map = {
-        "Commonwealth": "Commonwealth.png",
-        "Dominion": "Dominion.png",
-        "Leshavult": "Leshavault.png",
-        "Shade": "Shades.png",
-        "Commonwealth,Dominion": "Dominion_Commonwealth.png",
-        "Dominion,Commonwealth": "Dominion_Commonwealth.png",
-        "Commonwealth,Leshavult": "Commonwealth_Leshavault.png",
-        "Leshavult,Commonwealth": "Commonwealth_Leshavault.png",
-        "Dominion,Leshavult": "Dominion_Leshavault.png",
-        "Leshavult,Dominion": "Dominion_Leshavault.png",
-        "Dominion,Shade": "Shades_Dominion.png",
-        "Shade,Dominion": "Shades_Dominion.png",
-        "Leshavult,Shade": "Shades_Leshavault.png",
-        "Shade,Leshavult": "Shades_Leshavault.png",
-        "Shade,Commonwealth": "Commonwealth_Shades.png",
-        "Commonwealth,Shade": "Commonwealth_Shades.png"
-    }
-    
-    return faction_map.get(faction_string, None)
+    return _FACTION_SYMBOL_FILES.get(faction_string)
 
 def get_font(size, bold=False):
     """Get Verdana font with fallback options and improved rendering."""
@@ -527,6 +529,55 @@ def draw_signature_move_card(draw, signature_move, bg_x, bg_y, bg_width, bg_heig
                 draw_text_with_large_nulls(draw, (bg_x + margin, current_y), line, body_font_final, dark_gray)
                 current_y += line_spacing
 
+# create_wide_character_card results: the card was written, kept because it
+# was already up to date, or could not be created
+CARD_WRITTEN = 'written'
+CARD_SKIPPED = 'skipped'
+CARD_FAILED = 'failed'
+
+# A card is stale when this script is newer than it, as layout may have changed
+_SCRIPT_MTIME = os.path.getmtime(os.path.abspath(__file__))
+
+def card_is_up_to_date(output_path, input_paths, data_mtime):
+    """
+    True when output_path exists and is at least as new as every existing input
+    path, data_mtime and this script.
+    """
+    try:
+        output_mtime = os.path.getmtime(output_path)
+    except OSError:
+        return False
+    newest_input = max(data_mtime, _SCRIPT_MTIME)
+    for path in input_paths:
+        if os.path.exists(path):
+            newest_input = max(newest_input, os.path.getmtime(path))
+    return output_mtime >= newest_input
+
+_CANVASES = {}
+
+def cleared_canvas(size):
+    """
+    Return a black RGB canvas of the given size.
+    Every card shares the same size, so the buffer is allocated once per
+    process and blacked out in place between cards instead of reallocated.
+    """
+    canvas = _CANVASES.get(size)
+    if canvas is None:
+        canvas = _CANVASES[size] = Image.new('RGB', size, 'black')
+    else:
+        canvas.paste((0, 0, 0), (0, 0) + size)
+    return canvas
+
+def load_rgb_image(path, draft_size):
+    """
+    Open an image as RGB for scaling down to about draft_size.
+    JPEG sources decode at a reduced DCT scale that still covers draft_size
+    (draft is a no-op for PNG), and images already in RGB skip the convert copy.
+    """
+    image = Image.open(path)
+    image.draft('RGB', draft_size)
+    return image if image.mode == 'RGB' else image.convert('RGB')
+
 def resize_image_keep_aspect(image, max_width, max_height):
     """
     Resize an image while keeping aspect ratio to fit within max_width x max_height
@@ -544,24 +595,49 @@ def resize_image_keep_aspect(image, max_width, max_height):
     
     return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-def create_wide_character_card(character_name, characters_images_dir, output_dir, faction_symbols_dir, faction_string, character_data):
+# Base cards are intermediates for the left-side text step, so favour encode
+# speed over size: zlib level 1 encodes several times faster than level 6
+_PNG_SAVE_KWARGS = {"compress_level": 1, "optimize": False}
+
+@lru_cache(maxsize=32)
+def load_faction_symbol(faction_path, mtime, target_height):
+    """
+    Load a faction symbol as RGBA scaled to target_height, keeping aspect ratio.
+    Cached per (path, mtime, height): there are only a handful of faction
+    combinations, so each symbol is decoded and resized once per process.
+    The result is shared, so callers must not draw on it.
+    """
+    faction_symbol = Image.open(faction_path).convert('RGBA')
+    faction_aspect_ratio = faction_symbol.width / faction_symbol.height
+    faction_new_width = int(target_height * faction_aspect_ratio)
+    return faction_symbol.resize((faction_new_width, target_height), Image.Resampling.LANCZOS)
+
+def create_wide_character_card(character_name, characters_images_dir, output_dir, faction_symbols_dir, faction_string, character_data, data_mtime=None, force=False):
     """
     Create a wide character card for a given character
+    
+    data_mtime is the modification time of the file character_data came from.
+    When it is given and force is False, an existing card newer than it, both
+    source images, the faction symbol and this script is kept as is and
+    CARD_SKIPPED is returned. Without data_mtime the data's age is unknown,
+    so the card is always recreated.
+    
+    Returns CARD_WRITTEN when the card was created, CARD_FAILED when it could not be.
     """
     # Canvas dimensions
     canvas_width = 1200
     canvas_height = 700
     padding = 10
     
-    # Create black canvas
-    canvas = Image.new('RGB', (canvas_width, canvas_height), 'black')
+    safe_filename = character_name.replace('/', '_').replace('\\', '_')  # Handle special characters
+    output_path = os.path.join(output_dir, f"{safe_filename}_wide_card.png")
     
     # Character directory path
     char_dir = os.path.join(characters_images_dir, character_name)
     
     if not os.path.exists(char_dir):
         print(f"Warning: Character directory not found: {char_dir}")
-        return False
+        return CARD_FAILED
     
     # Paths to the images
     char_tile_path = os.path.join(char_dir, 'character_tile.png')
@@ -569,16 +645,28 @@ def create_wide_character_card(character_name, characters_images_dir, output_dir
     
     if not os.path.exists(char_tile_path):
         print(f"Warning: character_tile.png not found for {character_name}")
-        return False
+        return CARD_FAILED
     
     if not os.path.exists(background_path):
         print(f"Warning: background.png not found for {character_name}")
-        return False
+        return CARD_FAILED
+    
+    if data_mtime is not None and not force:
+        input_paths = [char_tile_path, background_path]
+        faction_filename = get_faction_symbol_filename(faction_string)
+        if faction_filename:
+            input_paths.append(os.path.join(faction_symbols_dir, faction_filename))
+        if card_is_up_to_date(output_path, input_paths, data_mtime):
+            print(f"Up to date: {output_path}")
+            return CARD_SKIPPED
+    
+    # Black canvas, reused across the cards this process creates
+    canvas = cleared_canvas((canvas_width, canvas_height))
     
     try:
         # Load images
-        char_tile = Image.open(char_tile_path).convert('RGB')
-        background = Image.open(background_path).convert('RGB')
+        char_tile = load_rgb_image(char_tile_path, (canvas_width, canvas_height))
+        background = load_rgb_image(background_path, (canvas_width, canvas_height))
         
         # Calculate available space for character tile
         char_tile_max_height = canvas_height - (padding * 2)  # Full height minus top/bottom padding
@@ -595,12 +683,13 @@ def create_wide_character_card(character_name, characters_images_dir, output_dir
         # Paste original character tile onto canvas
         canvas.paste(char_tile_resized, (char_tile_x, char_tile_y))
         
-        # Create flipped copy of character tile
-        char_tile_flipped = char_tile_resized.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-        
-        # Crop flipped tile to keep only the left 50%
-        flipped_crop_width = char_tile_flipped.width // 2
-        char_tile_flipped_cropped = char_tile_flipped.crop((0, 0, flipped_crop_width, char_tile_flipped.height))
+        # Flipped copy of the character tile, keeping only its left 50%. That
+        # half is the mirror of the tile's right half, so crop first and flip
+        # only the pixels that are kept
+        flipped_crop_width = char_tile_resized.width // 2
+        char_tile_flipped_cropped = char_tile_resized.crop(
+            (char_tile_resized.width - flipped_crop_width, 0, char_tile_resized.width, char_tile_resized.height)
+        ).transpose(Image.Transpose.FLIP_LEFT_RIGHT)
         
         # Position flipped tile directly to the right of original
         flipped_x = char_tile_x + char_tile_resized.width
@@ -647,9 +736,10 @@ def create_wide_character_card(character_name, characters_images_dir, output_dir
             divider_y = padding
             divider_height = background_max_height
             
-            # Create a black rectangle for the divider
-            draw = ImageDraw.Draw(canvas)
-            draw.rectangle([divider_x, divider_y, divider_x + divider_width, divider_y + divider_height], fill='black')
+            # Fill the divider box with black directly; the box matches the
+            # inclusive corners of the rectangle it replaces
+            divider_box = (divider_x, divider_y, divider_x + divider_width + 1, divider_y + divider_height + 1)
+            canvas.paste((0, 0, 0), divider_box)
             
             # Add signature move text overlay to background area AFTER basic background is placed
             signature_move = character_data.get('SignatureMove', {})
@@ -671,7 +761,7 @@ def create_wide_character_card(character_name, characters_images_dir, output_dir
             canvas.paste(background_with_text, (background_x, background_y), background_with_text)
             
             # Redraw the black divider on top of everything
-            draw.rectangle([divider_x, divider_y, divider_x + divider_width, divider_y + divider_height], fill='black')
+            canvas.paste((0, 0, 0), divider_box)
         
         # Add faction symbol in top-right of character area
         if faction_string:
@@ -680,13 +770,9 @@ def create_wide_character_card(character_name, characters_images_dir, output_dir
                 faction_path = os.path.join(faction_symbols_dir, faction_filename)
                 if os.path.exists(faction_path):
                     try:
-                        faction_symbol = Image.open(faction_path).convert('RGBA')
-                        
                         # Scale faction symbol to 140px height while keeping aspect ratio
-                        faction_target_height = 140
-                        faction_aspect_ratio = faction_symbol.width / faction_symbol.height
-                        faction_new_width = int(faction_target_height * faction_aspect_ratio)
-                        faction_resized = faction_symbol.resize((faction_new_width, faction_target_height), Image.Resampling.LANCZOS)
+                        faction_resized = load_faction_symbol(faction_path, os.path.getmtime(faction_path), 140)
+                        faction_new_width = faction_resized.width
                         
                         # Position in top-right of character area (touching the divider and top border)
                         faction_x = background_start_x - faction_new_width  # Touch the divider line
@@ -714,16 +800,28 @@ def create_wide_character_card(character_name, characters_images_dir, output_dir
         
         # Save the final image
         os.makedirs(output_dir, exist_ok=True)
-        safe_filename = character_name.replace('/', '_').replace('\\', '_')  # Handle special characters
-        output_path = os.path.join(output_dir, f"{safe_filename}_wide_card.png")
-        canvas.save(output_path, 'PNG')
+        canvas.save(output_path, 'PNG', **_PNG_SAVE_KWARGS)
         
         print(f"Created wide card for {character_name}: {output_path}")
-        return True
+        return CARD_WRITTEN
         
     except Exception as e:
         print(f"Error creating card for {character_name}: {str(e)}")
-        return False
+        return CARD_FAILED
+
+def _create_card_task(task):
+    """Process-pool worker: create one card from (entry, images dir, output dir, faction dir, data mtime, force)."""
+    entry, characters_images_dir, output_dir, faction_symbols_dir, data_mtime, force = task
+    return create_wide_character_card(entry['name'], characters_images_dir, output_dir, faction_symbols_dir, entry.get('faction', ''), entry, data_mtime, force)
+
+def _pool_context():
+    """Prefer fork on Linux so workers start without re-importing this script.
+
+    Elsewhere fork is unavailable or unsafe, so the platform default is used.
+    """
+    if sys.platform.startswith("linux") and "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
 
 def main():
     # Get the directory of this script
@@ -734,6 +832,8 @@ def main():
     characters_images_dir = os.path.join(script_dir, 'characters_images')
     faction_symbols_dir = os.path.join(script_dir, 'symbols_factions')
     output_dir = os.path.join(script_dir, 'generated_wide_cards')
+    # 'force': recreate every card, even those newer than all of their inputs
+    force = len(sys.argv) > 1 and sys.argv[1].lower() == 'force'
     
     # Check if moonstone_data.json exists
     if not os.path.exists(json_path):
@@ -758,8 +858,11 @@ def main():
         print(f"Error reading moonstone_data.json: {str(e)}")
         sys.exit(1)
     
-    # Process each character
-    successful_cards = 0
+    # Cards older than the character data are recreated
+    data_mtime = os.path.getmtime(json_path)
+    
+    # Collect each character's card job, then create them in parallel
+    tasks = []
     total_characters = 0
     
     for entry in moonstone_data:
@@ -768,15 +871,23 @@ def main():
             continue
             
         character_name = entry['name']
-        faction_string = entry.get('faction', '')
         total_characters += 1
         
         print(f"Processing {character_name}...")
         
-        if create_wide_character_card(character_name, characters_images_dir, output_dir, faction_symbols_dir, faction_string, entry):
-            successful_cards += 1
-    
-    print(f"\nCompleted! Successfully created {successful_cards} out of {total_characters} character cards.")
+        tasks.append((entry, characters_images_dir, output_dir, faction_symbols_dir, data_mtime, force))
+    
+    # Cards are independent and dominated by resize and PNG encode, so spread
+    # them over all cores
+    results = []
+    if tasks:
+        workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+            results = list(executor.map(_create_card_task, tasks, chunksize=4))
+    created_cards = sum(1 for r in results if r == CARD_WRITTEN)
+    up_to_date_cards = sum(1 for r in results if r == CARD_SKIPPED)
+    
+    print(f"\nCompleted! Successfully created {created_cards} out of {total_characters} character cards ({up_to_date_cards} already up to date).")
     print(f"Output directory: {output_dir}")
 
 if __name__ == "__main__":